@@ -1,12 +1,22 @@
-from flask import Flask, render_template, request, redirect, url_for, jsonify
+from flask import Flask, Response, render_template, request, redirect, url_for, jsonify, make_response
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
-import mysql.connector
 from datetime import datetime
-import requests
-import re
-from contextlib import contextmanager
+import hashlib
+import json
+import queue
 import os
+from db import get_db_connection, pool, PoolTimeout
+import season_cache
+import season_summary
+import events
+import lookup_jobs
+import single_flight
+import wiki_client
+import celebrities
+import names
+import rollover
+import scoring
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'deathpool-dev-key-change-in-production')
@@ -31,155 +41,14 @@ def load_user(user_id):
             return User(row['id'], row['name'], row['username'])
         return None
 
-# Database configuration
-DB_CONFIG = {
-    'host':     os.environ.get('DB_HOST', 'localhost'),
-    'user':     os.environ.get('DB_USER', 'root'),
-    'password': os.environ.get('DB_PASSWORD', ''),
-    'database': os.environ.get('DB_NAME', 'deathpool'),
-}
-
-@contextmanager
-def get_db_connection():
-    """Context manager for database connections"""
-    conn = mysql.connector.connect(**DB_CONFIG)
-    try:
-        yield conn
-    finally:
-        conn.close()
-
-def get_wikipedia_age(celebrity_name):
-    """Fetch age from Wikipedia using their API"""
-    try:
-        # Search for the person on Wikipedia
-        search_url = "https://en.wikipedia.org/w/api.php"
-        search_params = {
-            'action': 'query',
-            'list': 'search',
-            'srsearch': celebrity_name,
-            'format': 'json',
-            'srlimit': 1
-        }
-
-        headers = {
-            'User-Agent': 'DeathpoolApp/1.0 (Educational project; Python/Requests)'
-        }
-
-        print(f"Looking up: {celebrity_name}")
-        response = requests.get(search_url, params=search_params, headers=headers, timeout=10)
-        print(f"Search response status: {response.status_code}")
-
-        if response.status_code != 200:
-            print(f"Error: Got status {response.status_code}")
-            return None
-
-        data = response.json()
-        print(f"Search results: {len(data.get('query', {}).get('search', []))} found")
-
-        if not data.get('query', {}).get('search'):
-            return None
-
-        # Get the page content and description
-        page_title = data['query']['search'][0]['title']
-        print(f"Found page: {page_title}")
-
-        content_params = {
-            'action': 'query',
-            'prop': 'revisions|description',
-            'titles': page_title,
-            'rvprop': 'content',
-            'format': 'json',
-            'rvslots': 'main'
-        }
-
-        response = requests.get(search_url, params=content_params, headers=headers, timeout=10)
-        print(f"Content response status: {response.status_code}")
-
-        if response.status_code != 200:
-            print(f"Error: Got status {response.status_code}")
-            return None
-
-        pages = response.json()['query']['pages']
-        page = list(pages.values())[0]
-
-        if 'revisions' not in page:
-            return None
-
-        content = page['revisions'][0]['slots']['main']['*']
-        description = page.get('description', '')
-
-        # Try to find birth date in the infobox
-        birth_date_patterns = [
-            r'birth_date\s*=\s*\{\{(?:birth date and age|birth date)\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'birth_date\s*=\s*\{\{dob\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'birth_date\s*=\s*\{\{bda\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'birth_date\s*=\s*\{\{(?:birth date and age|birth date)\|(?:mf=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-        ]
-
-        birth_date = None
-        birth_dt = None
-
-        for pattern in birth_date_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                year, month, day = match.groups()
-                birth_date = f"{year}-{int(month):02d}-{int(day):02d}"
-                birth_dt = datetime.strptime(birth_date, '%Y-%m-%d')
-                break
-
-        if not birth_date:
-            print(f"Could not find birth date in Wikipedia content for {celebrity_name}")
-            return None
-
-        # Try to find death date in the infobox (handles nested templates like {{circa|{{death date...}}}})
-        death_date_patterns = [
-            r'death_date\s*=\s*\{\{(?:circa\|)?\{\{(?:death date and age|death date)\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'death_date\s*=\s*\{\{(?:death date and age|death date)\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'death_date\s*=\s*\{\{dda\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'death_date\s*=\s*\{\{(?:death date and age|death date)\|(?:mf=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-        ]
-
-        death_date = None
-        death_age = None
-
-        for pattern in death_date_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                year, month, day = match.groups()
-                death_date = f"{year}-{int(month):02d}-{int(day):02d}"
-                death_dt = datetime.strptime(death_date, '%Y-%m-%d')
-                death_age = death_dt.year - birth_dt.year - ((death_dt.month, death_dt.day) < (birth_dt.month, birth_dt.day))
-                break
-
-        # Calculate current age (or age at death)
-        if death_date:
-            age = death_age
-        else:
-            today = datetime.now()
-            age = today.year - birth_dt.year - ((today.month, today.day) < (birth_dt.month, birth_dt.day))
-
-        wiki_url = f"https://en.wikipedia.org/wiki/{page_title.replace(' ', '_')}"
-
-        result = {
-            'age': age,
-            'birth_date': birth_date,
-            'death_date': death_date,
-            'death_age': death_age,
-            'wiki_url': wiki_url,
-            'description': description
-        }
-
-        if death_date:
-            print(f"✓ Found {celebrity_name}: Age {age}, DECEASED on {death_date}")
-        else:
-            print(f"✓ Found {celebrity_name}: Age {age} years old")
+@app.errorhandler(PoolTimeout)
+def pool_timeout(e):
+    return jsonify({'error': 'Database busy, please retry'}), 503
 
-        return result
-    except Exception as e:
-        print(f"Error fetching age for {celebrity_name}: {type(e).__name__}: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+# Lookups run on background threads so a slow Wikipedia never ties up a request,
+# and simultaneous lookups of one person, from any process, share a single fetch
+lookup_flight = single_flight.SingleFlight(wiki_client.get_wikipedia_age)
+lookup_workers = lookup_jobs.LookupWorkers(lookup_flight)
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
@@ -214,9 +83,10 @@ def index():
     with get_db_connection() as conn:
         cursor = conn.cursor(dictionary=True)
 
-        # Get all available seasons
-        cursor.execute("SELECT season_year FROM season_config ORDER BY season_year DESC")
-        available_seasons = [row['season_year'] for row in cursor.fetchall()]
+        # One small query gives both the season list and this season's config
+        cursor.execute("SELECT * FROM season_config ORDER BY season_year DESC")
+        seasons = cursor.fetchall()
+        available_seasons = [row['season_year'] for row in seasons]
 
         # Auto-create season config if it doesn't exist
         if season_year not in available_seasons:
@@ -225,11 +95,11 @@ def index():
                 VALUES (%s, %s)
             """, (season_year, f'{season_year}-12-31 23:59:59'))
             conn.commit()
+            cursor.execute("SELECT * FROM season_config WHERE season_year = %s", (season_year,))
+            season = cursor.fetchone()
             available_seasons.insert(0, season_year)
-
-        # Get current season config
-        cursor.execute("SELECT * FROM season_config WHERE season_year = %s", (season_year,))
-        season = cursor.fetchone()
+        else:
+            season = seasons[available_seasons.index(season_year)]
 
         # Calculate time remaining
         end_date = season['end_date'] if isinstance(season['end_date'], datetime) else datetime.strptime(str(season['end_date']).strip(), '%Y-%m-%d %H:%M:%S')
@@ -237,112 +107,108 @@ def index():
         days_remaining = max(0, time_remaining.days)
         hours_remaining = max(0, time_remaining.seconds // 3600) if days_remaining >= 0 else 0
 
-        # Get leaderboard
-        cursor.execute("""
-            SELECT
-                p.name,
-                p.id,
-                COALESCE(SUM(pk.points), 0) as total_points,
-                COUNT(CASE WHEN pk.death_date IS NOT NULL THEN 1 END) as deaths_count
-            FROM participants p
-            LEFT JOIN picks pk ON p.id = pk.participant_id AND pk.season_year = %s
-            GROUP BY p.id, p.name
-            ORDER BY total_points DESC, deaths_count DESC
-        """, (season_year,))
-        leaderboard = cursor.fetchall()
-
-        # Get first blood info (all picks with the earliest death date - handles ties)
-        cursor.execute("""
-            SELECT p.name, pk.celebrity_name, pk.death_date, pk.death_age, pk.points
-            FROM picks pk
-            JOIN participants p ON pk.participant_id = p.id
-            WHERE pk.death_date = (
-                SELECT MIN(death_date)
-                FROM picks
-                WHERE death_date IS NOT NULL AND season_year = %s
-            )
-            AND pk.season_year = %s
-            ORDER BY p.name
-        """, (season_year, season_year))
-        first_blood_picks = cursor.fetchall()
-
-        # Get all picks with details
-        cursor.execute("""
-            SELECT
-                pk.*,
-                p.name as participant_name
-            FROM picks pk
-            JOIN participants p ON pk.participant_id = p.id
-            WHERE pk.season_year = %s
-            ORDER BY p.name, pk.celebrity_name
-        """, (season_year,))
-        all_picks = cursor.fetchall()
-
-        # Determine first blood picks (all with earliest death date) and mark them
-        first_blood_pick_ids = set()
-        if first_blood_picks:
-            earliest_death_date = first_blood_picks[0]['death_date']
-            first_blood_pick_ids = {
-                pick['id'] for pick in all_picks
-                if pick['death_date'] == earliest_death_date
-            }
-
-        # Group picks by participant and mark first blood
         # For unlocked seasons, only show each user their own picks (draft privacy)
         picks_locked = bool(season.get('picks_locked', 0))
-        picks_by_participant = {}
-        for pick in all_picks:
-            pick['is_first_blood'] = (pick['id'] in first_blood_pick_ids)
-            participant = pick['participant_name']
-            if not picks_locked:
-                # Draft mode: only show your own picks
-                if not current_user.is_authenticated or pick['participant_id'] != current_user.id:
-                    continue
-            if participant not in picks_by_participant:
-                picks_by_participant[participant] = []
-            picks_by_participant[participant].append(pick)
-
-        # Get participant IDs for the import button
-        cursor.execute("SELECT id, name FROM participants ORDER BY name")
-        participants = cursor.fetchall()
-
-        season_start = datetime(season_year, 1, 1).date()
-
-        # Compute fun stats per participant
-        stats_by_participant = {}
-        for p in participants:
-            p_picks = picks_by_participant.get(p['name'], [])
-            picks_with_age = [pk for pk in p_picks if pk.get('age')]
-            avg_age = round(sum(pk['age'] for pk in picks_with_age) / len(picks_with_age), 1) if picks_with_age else None
-            oldest = max(picks_with_age, key=lambda x: x['age']) if picks_with_age else None
-            youngest = min(picks_with_age, key=lambda x: x['age']) if picks_with_age else None
-            stats_by_participant[p['name']] = {
-                'avg_age': avg_age,
-                'oldest': oldest,
-                'youngest': youngest,
-                'picks_with_age_count': len(picks_with_age),
-            }
-
-        return render_template('index.html',
-                             leaderboard=leaderboard,
-                             first_blood_picks=first_blood_picks,
-                             picks_by_participant=picks_by_participant,
+        viewer_id = current_user.id if current_user.is_authenticated else None
+
+        # The page only changes when the season's data, its config, the season
+        # list, the viewer or the countdown's hour does. Answer 304 from that
+        # watermark before running the heavy query or rendering anything.
+        # Every page depends on who is viewing, which a Last-Modified date
+        # can't express, so the ETag is the only validator.
+        mark = season_cache.watermark(cursor, season)
+        etag = hashlib.sha1(repr((
+            mark, available_seasons, str(end_date), picks_locked,
+            season.get('first_blood_winner_id'), viewer_id, days_remaining, hours_remaining,
+        )).encode()).hexdigest()
+        if request.if_none_match.contains_weak(etag):
+            return _conditional(app.response_class(status=304), etag)
+
+        # Leaderboard, First Blood and picks only change with the watermark,
+        # so reuse them until then
+        summary = season_cache.get(season_year, mark)
+        if summary is None:
+            summary = season_summary.load(cursor, season_year)
+            season_cache.put(season_year, mark, summary)
+
+        html = render_template('index.html',
+                             leaderboard=summary['leaderboard'],
+                             first_blood_picks=summary['first_blood_picks'],
+                             first_blood_names=summary['first_blood_names'],
+                             any_deaths=summary['any_deaths'],
+                             participants=season_summary.visible_cards(summary, picks_locked, viewer_id),
                              days_remaining=days_remaining,
                              hours_remaining=hours_remaining,
                              season_end=end_date.strftime('%B %d, %Y at %I:%M:%S %p'),
-                             season_start=season_start,
+                             season_start=datetime(season_year, 1, 1).date(),
                              season_year=season_year,
                              available_seasons=available_seasons,
-                             participants=participants,
-                             stats_by_participant=stats_by_participant,
                              picks_locked=picks_locked)
+        return _conditional(make_response(html), etag)
+
+def _conditional(response, etag):
+    response.set_etag(etag, weak=True)
+    # Per-viewer page: browsers may keep it but must revalidate every time
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+@app.route('/events')
+def event_stream():
+    """Server-Sent Events stream of leaderboard and pick deltas for a season"""
+    season_year = int(request.args.get('season', datetime.now().year))
+    viewer_id = current_user.id if current_user.is_authenticated else None
+    last_event_id = request.headers.get('Last-Event-ID', type=int)
+
+    def message(row):
+        payload = events.for_viewer(json.loads(row['payload']), viewer_id)
+        return f"id: {row['id']}\nevent: pick\ndata: {json.dumps(payload)}\n\n"
+
+    def stream():
+        with events.broker.subscribe(season_year) as q:
+            yield f"retry: {int(events.POLL_INTERVAL * 5000)}\n\n"
+            # A reconnecting browser catches up on what it missed, straight from the table;
+            # the same rows may also arrive live on the queue, so those are skipped below
+            replayed = -1
+            if last_event_id is not None:
+                for row in events.fetch_since(last_event_id, season_year):
+                    replayed = row['id']
+                    yield message(row)
+            while True:
+                try:
+                    row = q.get(timeout=events.HEARTBEAT)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                if row['id'] <= replayed:
+                    continue
+                yield message(row)
+
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
-@app.route('/lookup_age/<int:pick_id>')
+@app.route('/stats')
 @login_required
-def lookup_age(pick_id):
-    """Look up age for a specific pick"""
+def stats():
+    """Runtime stats for sizing the deployment"""
     with get_db_connection() as conn:
         cursor = conn.cursor(dictionary=True)
+        name_dedup = celebrities.dedup_report(cursor)
+    return jsonify({
+        'db_pool': pool.stats(),
+        'season_cache': season_cache.stats(),
+        'event_streams': events.broker.subscriber_count(),
+        'wikipedia': wiki_client.stats(),
+        'lookup_coalescing': lookup_flight.stats(),
+        'name_dedup': name_dedup,
+    })
+
+@app.route('/lookup_age/<int:pick_id>', methods=['POST'])
+@login_required
+def lookup_age(pick_id):
+    """Queue an age lookup for a specific pick"""
+    with get_db_connection(write=True) as conn:
+        cursor = conn.cursor(dictionary=True)
 
         cursor.execute("SELECT celebrity_name, participant_id, season_year FROM picks WHERE id = %s", (pick_id,))
         pick = cursor.fetchone()
@@ -353,66 +219,58 @@ def lookup_age(pick_id):
         if pick['participant_id'] != current_user.id:
             return jsonify({'error': 'Not your pick'}), 403
 
-        result = get_wikipedia_age(pick['celebrity_name'])
+        # A spelling we've resolved before is looked up by its exact title, skipping the search
+        celebrity = celebrities.find_by_name(cursor, pick['celebrity_name'])
+        query = celebrity['title'] if celebrity else pick['celebrity_name']
+        job_id = lookup_jobs.submit(cursor, pick_id, query)
+        conn.commit()
 
-        if result and result['age'] is not None:
-            if result['death_date']:
-                points = max(0, 100 - result['death_age'])
+    lookup_workers.notify()
+    status_url = url_for('job_status', job_id=job_id)
+    return jsonify({'job_id': job_id, 'status_url': status_url}), 202, {'Location': status_url}
 
-                cursor.execute("""
-                    SELECT COUNT(*) as death_count
-                    FROM picks
-                    WHERE season_year = %s AND death_date IS NOT NULL
-                """, (pick['season_year'],))
-                is_first_blood = (cursor.fetchone()['death_count'] == 0)
+@app.route('/jobs/<int:job_id>')
+@login_required
+def job_status(job_id):
+    """Progress of a queued lookup"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        job = lookup_jobs.get_job(cursor, job_id)
 
-                cursor.execute("""
-                    UPDATE picks
-                    SET age = %s, birth_date = %s, death_date = %s, death_age = %s,
-                        points = ?, is_first_blood = ?, wikipedia_url = ?, description = ?
-                    WHERE id = %s
-                """, (result['age'], result['birth_date'], result['death_date'],
-                      result['death_age'], points, is_first_blood, result['wiki_url'], result['description'], pick_id))
-
-                if is_first_blood:
-                    cursor.execute("""
-                        UPDATE season_config
-                        SET first_blood_winner_id = %s
-                        WHERE season_year = %s
-                    """, (pick['participant_id'], pick['season_year']))
-            else:
-                cursor.execute("""
-                    UPDATE picks
-                    SET age = %s, birth_date = %s, wikipedia_url = %s, description = %s
-                    WHERE id = %s
-                """, (result['age'], result['birth_date'], result['wiki_url'], result['description'], pick_id))
+    if not job or job['participant_id'] != current_user.id:
+        return jsonify({'error': 'Job not found'}), 404
 
-            conn.commit()
+    return jsonify({
+        'job_id': job['id'],
+        'pick_id': job['pick_id'],
+        'status': job['status'],
+        'attempts': job['attempts'],
+        'result': job['result'],
+    })
 
-            return jsonify({
-                'success': True,
-                'age': result['age'],
-                'birth_date': result['birth_date'],
-                'death_date': result['death_date'],
-                'deceased': result['death_date'] is not None
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Could not find age information'
-            })
+def _valid_date(value):
+    """Whether a submitted date is a real YYYY-MM-DD date"""
+    try:
+        datetime.strptime(value or '', '%Y-%m-%d')
+    except ValueError:
+        return False
+    return True
 
 @app.route('/mark_death/<int:pick_id>', methods=['POST'])
 @login_required
 def mark_death(pick_id):
-    """Mark a celebrity as deceased and calculate points"""
+    """Mark a celebrity as deceased; the database derives age at death and points"""
     death_date = request.form.get('death_date')
     season_year = int(request.form.get('season_year', datetime.now().year))
 
-    with get_db_connection() as conn:
+    # A missing date would reach score_deaths as NULL and bring the pick back to life
+    if not _valid_date(death_date):
+        return jsonify({'error': 'Death date must be YYYY-MM-DD'}), 400
+
+    with get_db_connection(write=True) as conn:
         cursor = conn.cursor(dictionary=True)
 
-        cursor.execute("SELECT * FROM picks WHERE id = %s", (pick_id,))
+        cursor.execute("SELECT participant_id, season_year FROM picks WHERE id = %s", (pick_id,))
         pick = cursor.fetchone()
 
         if not pick:
@@ -421,39 +279,10 @@ def mark_death(pick_id):
         if pick['participant_id'] != current_user.id:
             return redirect(url_for('index', season=season_year))
 
-        # Calculate death age and points
-        death_dt = datetime.strptime(death_date, '%Y-%m-%d')
-
-        if pick['birth_date']:
-            birth_dt = datetime.strptime(str(pick['birth_date']), '%Y-%m-%d')
-            death_age = death_dt.year - birth_dt.year - ((death_dt.month, death_dt.day) < (birth_dt.month, birth_dt.day))
-        else:
-            death_age = pick['age'] if pick['age'] else 0
-
-        points = max(0, 100 - death_age)
-
-        # Check if this is the first death of the season (First Blood)
-        cursor.execute("""
-            SELECT COUNT(*) as death_count
-            FROM picks
-            WHERE season_year = %s AND death_date IS NOT NULL
-        """, (pick['season_year'],))
-        result = cursor.fetchone()
-        is_first_blood = (result['death_count'] == 0)
-
-        cursor.execute("""
-            UPDATE picks
-            SET death_date = %s, death_age = %s, points = %s, is_first_blood = %s
-            WHERE id = %s
-        """, (death_date, death_age, points, is_first_blood, pick_id))
-
-        if is_first_blood:
-            cursor.execute("""
-                UPDATE season_config
-                SET first_blood_winner_id = %s
-                WHERE season_year = %s
-            """, (pick['participant_id'], pick['season_year']))
+        scoring.score_deaths(cursor, pick['season_year'], [(pick_id, death_date)])
 
+        season_cache.bump_version(cursor, pick['season_year'])
+        events.publish_pick_changes(cursor, pick['season_year'], [pick_id])
         conn.commit()
 
         return redirect(url_for('index', season=season_year))
@@ -464,28 +293,19 @@ def unmark_death(pick_id):
     """Remove death marking from a pick"""
     season_year = int(request.form.get('season_year', datetime.now().year))
 
-    with get_db_connection() as conn:
+    with get_db_connection(write=True) as conn:
         cursor = conn.cursor(dictionary=True)
 
-        cursor.execute("SELECT is_first_blood, season_year, participant_id FROM picks WHERE id = %s", (pick_id,))
+        cursor.execute("SELECT season_year, participant_id FROM picks WHERE id = %s", (pick_id,))
         pick = cursor.fetchone()
 
         if pick and pick['participant_id'] != current_user.id:
             return redirect(url_for('index', season=season_year))
 
-        cursor.execute("""
-            UPDATE picks
-            SET death_date = NULL, death_age = NULL, points = 0, is_first_blood = 0
-            WHERE id = %s
-        """, (pick_id,))
-
-        if pick and pick['is_first_blood']:
-            cursor.execute("""
-                UPDATE season_config
-                SET first_blood_winner_id = NULL
-                WHERE season_year = %s
-            """, (pick['season_year'],))
-
+        if pick:
+            scoring.clear_death(cursor, pick['season_year'], pick_id)
+            season_cache.bump_version(cursor, pick['season_year'])
+            events.publish_pick_changes(cursor, pick['season_year'], [pick_id])
         conn.commit()
 
         return redirect(url_for('index', season=season_year))
@@ -501,14 +321,28 @@ def add_pick():
     if participant_id != current_user.id:
         return redirect(url_for('index', season=season_year))
 
-    with get_db_connection() as conn:
+    with get_db_connection(write=True) as conn:
         cursor = conn.cursor(dictionary=True)
 
+        # Conditional insert: picking a name you already have, under any spelling, does nothing
+        name_key = names.normalize(celebrity_name)
         cursor.execute("""
-            INSERT INTO picks (participant_id, celebrity_name, season_year)
-            VALUES (%s, %s, %s)
-        """, (participant_id, celebrity_name, season_year))
+            INSERT INTO picks (participant_id, celebrity_name, season_year, name_key)
+            SELECT id, %s, %s, %s FROM participants
+            WHERE id = %s AND NOT EXISTS (
+                SELECT 1 FROM picks WHERE participant_id = %s AND season_year = %s AND name_key = %s
+            )
+        """, (celebrity_name, season_year, name_key, participant_id, participant_id, season_year, name_key))
+        if cursor.rowcount != 1:
+            return redirect(url_for('index', season=season_year))
+        pick_id = cursor.lastrowid
+
+        # Someone already looked up under any spelling needs no Wikipedia call
+        celebrity = celebrities.find_by_name(cursor, celebrity_name)
+        if celebrity:
+            celebrities.attach(cursor, pick_id, celebrity)
 
+        season_cache.bump_version(cursor, season_year)
         conn.commit()
 
         return redirect(url_for('index', season=season_year))
@@ -519,13 +353,20 @@ def delete_pick(pick_id):
     """Delete a pick"""
     season_year = int(request.form.get('season_year', datetime.now().year))
 
-    with get_db_connection() as conn:
+    with get_db_connection(write=True) as conn:
         cursor = conn.cursor(dictionary=True)
-        cursor.execute("SELECT participant_id FROM picks WHERE id = %s", (pick_id,))
+        cursor.execute("SELECT id, participant_id, season_year, death_date FROM picks WHERE id = %s", (pick_id,))
         pick = cursor.fetchone()
         if not pick or pick['participant_id'] != current_user.id:
             return redirect(url_for('index', season=season_year))
+        if pick['death_date']:
+            # First Blood may pass to the next earliest death
+            scoring.lock_season(cursor, pick['season_year'])
         cursor.execute("DELETE FROM picks WHERE id = %s", (pick_id,))
+        if pick['death_date']:
+            scoring.resolve_first_blood(cursor, pick['season_year'])
+        season_cache.bump_version(cursor, pick['season_year'])
+        events.publish_pick_changes(cursor, pick['season_year'], [], removed=[pick])
         conn.commit()
 
         return redirect(url_for('index', season=season_year))
@@ -541,34 +382,9 @@ def import_from_last_year():
         return redirect(url_for('index', season=season_year))
     last_year = season_year - 1
 
-    with get_db_connection() as conn:
+    with get_db_connection(write=True) as conn:
         cursor = conn.cursor(dictionary=True)
-
-        # Get all living picks from last season for this participant
-        cursor.execute("""
-            SELECT celebrity_name, age, birth_date, wikipedia_url, description
-            FROM picks
-            WHERE participant_id = %s AND season_year = %s AND death_date IS NULL
-        """, (participant_id, last_year))
-        living_picks = cursor.fetchall()
-
-        # Get names already picked this season to avoid duplicates
-        cursor.execute("""
-            SELECT celebrity_name FROM picks
-            WHERE participant_id = %s AND season_year = %s
-        """, (participant_id, season_year))
-        existing = {row['celebrity_name'] for row in cursor.fetchall()}
-
-        imported = 0
-        for pick in living_picks:
-            if pick['celebrity_name'] not in existing:
-                cursor.execute("""
-                    INSERT INTO picks (participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """, (participant_id, pick['celebrity_name'], season_year,
-                      pick['age'], pick['birth_date'], pick['wikipedia_url'], pick['description']))
-                imported += 1
-
+        imported = rollover.roll_over(cursor, season_year, participant_id)
         conn.commit()
         print(f"Imported {imported} picks from {last_year} for participant {participant_id}")
 
@@ -588,30 +404,26 @@ def update_date(pick_id):
     if not new_date:
         return jsonify({'success': False, 'error': 'No date provided'}), 400
 
-    with get_db_connection() as conn:
-        cursor = conn.cursor(dictionary=True)
+    if not _valid_date(new_date):
+        return jsonify({'success': False, 'error': 'Date must be YYYY-MM-DD'}), 400
 
-        if date_type == 'birth':
-            cursor.execute("SELECT * FROM picks WHERE id = %s", (pick_id,))
-            pick = cursor.fetchone()
+    with get_db_connection(write=True) as conn:
+        cursor = conn.cursor(dictionary=True)
 
-            if not pick or pick['participant_id'] != current_user.id:
-                return jsonify({'success': False, 'error': 'Not your pick'}), 403
+        cursor.execute("SELECT participant_id, season_year, birth_date, death_date FROM picks WHERE id = %s", (pick_id,))
+        pick = cursor.fetchone()
 
-            birth_dt = datetime.strptime(new_date, '%Y-%m-%d')
+        if not pick or pick['participant_id'] != current_user.id:
+            return jsonify({'success': False, 'error': 'Not your pick'}), 403
 
+        # death_age and points follow from the dates in the database
+        if date_type == 'birth':
             if pick['death_date']:
-                death_dt = datetime.strptime(str(pick['death_date']), '%Y-%m-%d')
-                death_age = death_dt.year - birth_dt.year - ((death_dt.month, death_dt.day) < (birth_dt.month, birth_dt.day))
-                age = death_age
-                points = max(0, 100 - death_age)
-
-                cursor.execute("""
-                    UPDATE picks
-                    SET birth_date = %s, age = %s, death_age = %s, points = %s
-                    WHERE id = %s
-                """, (new_date, age, death_age, points, pick_id))
+                cursor.execute("UPDATE picks SET birth_date = %s WHERE id = %s", (new_date, pick_id))
+                # A deceased pick's age is its age at death
+                cursor.execute("UPDATE picks SET age = death_age WHERE id = %s", (pick_id,))
             else:
+                birth_dt = datetime.strptime(new_date, '%Y-%m-%d')
                 today = datetime.now()
                 age = today.year - birth_dt.year - ((today.month, today.day) < (birth_dt.month, birth_dt.day))
 
@@ -622,26 +434,14 @@ def update_date(pick_id):
                 """, (new_date, age, pick_id))
 
         elif date_type == 'death':
-            cursor.execute("SELECT * FROM picks WHERE id = %s", (pick_id,))
-            pick = cursor.fetchone()
-
-            if not pick or pick['participant_id'] != current_user.id:
-                return jsonify({'success': False, 'error': 'Not your pick'}), 403
-
             if not pick['birth_date']:
                 return jsonify({'success': False, 'error': 'Cannot set death date without birth date'}), 400
 
-            death_dt = datetime.strptime(new_date, '%Y-%m-%d')
-            birth_dt = datetime.strptime(str(pick['birth_date']), '%Y-%m-%d')
-            death_age = death_dt.year - birth_dt.year - ((death_dt.month, death_dt.day) < (birth_dt.month, birth_dt.day))
-            points = max(0, 100 - death_age)
-
-            cursor.execute("""
-                UPDATE picks
-                SET death_date = %s, death_age = %s, points = %s
-                WHERE id = %s
-            """, (new_date, death_age, points, pick_id))
+            # A new death date can change who holds First Blood
+            scoring.score_deaths(cursor, pick['season_year'], [(pick_id, new_date)])
 
+        season_cache.bump_version(cursor, pick['season_year'])
+        events.publish_pick_changes(cursor, pick['season_year'], [pick_id])
         conn.commit()
 
         return jsonify({'success': True})
@@ -1,205 +1,103 @@
-import mysql.connector
-import requests
-import re
-from datetime import datetime
 import time
 
-DB_CONFIG = {
-    'host': 'localhost',
-    'user': 'root',
-    'password': '14231423',
-    'database': 'deathpool'
-}
-
-def get_wikipedia_age(celebrity_name):
-    """Fetch age from Wikipedia using their API"""
-    try:
-        search_url = "https://en.wikipedia.org/w/api.php"
-        search_params = {
-            'action': 'query',
-            'list': 'search',
-            'srsearch': celebrity_name,
-            'format': 'json',
-            'srlimit': 1
-        }
-
-        headers = {
-            'User-Agent': 'DeathpoolApp/1.0 (Educational project; Python/Requests)'
-        }
-
-        response = requests.get(search_url, params=search_params, headers=headers, timeout=10)
-
-        if response.status_code != 200:
-            return None
-
-        data = response.json()
-
-        if not data.get('query', {}).get('search'):
-            return None
-
-        # Get the page content and description
-        page_title = data['query']['search'][0]['title']
-        page_id = data['query']['search'][0]['pageid']
-
-        content_params = {
-            'action': 'query',
-            'prop': 'revisions|description',
-            'titles': page_title,
-            'rvprop': 'content',
-            'format': 'json',
-            'rvslots': 'main'
-        }
-
-        response = requests.get(search_url, params=content_params, headers=headers, timeout=10)
-
-        if response.status_code != 200:
-            return None
-
-        pages = response.json()['query']['pages']
-        page = list(pages.values())[0]
-
-        if 'revisions' not in page:
-            return None
-
-        content = page['revisions'][0]['slots']['main']['*']
-        description = page.get('description', '')
-
-        # Try to find birth date in the infobox
-        birth_date_patterns = [
-            r'birth_date\s*=\s*\{\{(?:birth date and age|birth date)\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'birth_date\s*=\s*\{\{dob\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'birth_date\s*=\s*\{\{bda\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'birth_date\s*=\s*\{\{(?:birth date and age|birth date)\|(?:mf=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-        ]
-
-        birth_date = None
-        birth_dt = None
-
-        for pattern in birth_date_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                year, month, day = match.groups()
-                birth_date = f"{year}-{int(month):02d}-{int(day):02d}"
-                birth_dt = datetime.strptime(birth_date, '%Y-%m-%d')
-                break
-
-        if not birth_date:
-            return None
-
-        # Try to find death date in the infobox (handles nested templates like {{circa|{{death date...}}}})
-        death_date_patterns = [
-            r'death_date\s*=\s*\{\{(?:circa\|)?\{\{(?:death date and age|death date)\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'death_date\s*=\s*\{\{(?:death date and age|death date)\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'death_date\s*=\s*\{\{dda\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-            r'death_date\s*=\s*\{\{(?:death date and age|death date)\|(?:mf=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
-        ]
-
-        death_date = None
-        death_age = None
-
-        for pattern in death_date_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                year, month, day = match.groups()
-                death_date = f"{year}-{int(month):02d}-{int(day):02d}"
-                death_dt = datetime.strptime(death_date, '%Y-%m-%d')
-                death_age = death_dt.year - birth_dt.year - ((death_dt.month, death_dt.day) < (birth_dt.month, birth_dt.day))
-                break
-
-        # Calculate current age (or age at death)
-        if death_date:
-            age = death_age
-        else:
-            today = datetime.now()
-            age = today.year - birth_dt.year - ((today.month, today.day) < (birth_dt.month, birth_dt.day))
-
-        wiki_url = f"https://en.wikipedia.org/wiki/{page_title.replace(' ', '_')}"
-
-        return {
-            'age': age,
-            'birth_date': birth_date,
-            'death_date': death_date,
-            'death_age': death_age,
-            'wiki_url': wiki_url,
-            'description': description
-        }
-    except Exception as e:
-        print(f"Error for {celebrity_name}: {e}")
-        return None
-
-def batch_lookup():
-    conn = mysql.connector.connect(**DB_CONFIG)
+import celebrities
+import db
+import names
+import rollover
+import wiki_client
+
+def batch_lookup(concurrency=wiki_client.CONCURRENCY):
+    conn = db.connect()
     cursor = conn.cursor(dictionary=True)
 
-    # Get all picks without age
+    # Name keys first, skipping any that would give a participant the same name twice
+    keyed = rollover.fill_name_keys(cursor, (2025,))
+    conn.commit()
+    print(f"Set the name key of {keyed} picks")
+
+    # Get all picks without age, or not yet linked to a celebrity and name key
     cursor.execute("""
         SELECT id, celebrity_name
         FROM picks
-        WHERE season_year = 2025 AND (age IS NULL OR birth_date IS NULL)
+        WHERE season_year = 2025 AND (age IS NULL OR birth_date IS NULL OR celebrity_id IS NULL OR name_key IS NULL)
         ORDER BY celebrity_name
     """)
 
     picks = cursor.fetchall()
     total = len(picks)
 
-    print(f"\nFound {total} celebrities without age data")
+    print(f"\nFound {total} picks without age data or a linked celebrity")
     print("=" * 60)
 
     success = 0
     failed = 0
-
-    for i, pick in enumerate(picks, 1):
-        pick_id = pick['id']
-        celebrity = pick['celebrity_name']
-
-        print(f"\n[{i}/{total}] Looking up: {celebrity}")
-
-        result = get_wikipedia_age(celebrity)
-
-        if result and result['age'] is not None:
+    done = 0
+    latencies = []
+    started = time.monotonic()
+
+    # Spellings of the same name share one lookup, by exact title if we've resolved it before
+    titles = celebrities.known_titles(cursor, [pick['celebrity_name'] for pick in picks])
+    by_key = {}
+    by_query = {}
+    for pick in picks:
+        query = by_key.setdefault(names.normalize(pick['celebrity_name']),
+                                  titles.get(pick['celebrity_name'], pick['celebrity_name']))
+        by_query.setdefault(query, []).append(pick)
+
+    for queries, results, seconds, error in wiki_client.lookup_batches(list(by_query), concurrency):
+        chunk = [pick for query in queries for pick in by_query[query]]
+        done += len(chunk)
+        print(f"\n[{done}/{total}] Looked up {len(queries)} celebrities")
+
+        if error:
+            print(f"  ✗ Error: {error}")
+            failed += len(chunk)
+            continue
+        latencies.append(seconds)
+
+        # One transaction per chunk: store each person once, then copy them onto all their picks
+        found = {}
+        for query in queries:
+            result = results[query]
+            for pick in by_query[query]:
+                if result and result['age'] is not None:
+                    if result['page_id'] not in found:
+                        celebrities.save(cursor, result)
+                        celebrities.remember_name(cursor, result['title'], result['page_id'])
+                        found[result['page_id']] = result
+                    celebrities.link(cursor, pick['id'], result['page_id'])
+                    celebrities.remember_name(cursor, pick['celebrity_name'], result['page_id'])
+                    success += 1
+                else:
+                    print(f"  ✗ {pick['celebrity_name']}: Not found")
+                    failed += 1
+
+        for result in found.values():
+            updated = celebrities.fan_out(cursor, result)
+            print(f"  ✓ {result['title']}: Age {result['age']}, Born {result['birth_date']} ({len(updated)} picks)")
             if result['death_date']:
-                # Calculate points for deceased person
-                points = max(0, 100 - result['death_age'])
-
-                # Check if this is first blood
-                cursor.execute("""
-                    SELECT COUNT(*) as death_count
-                    FROM picks
-                    WHERE season_year = 2025 AND death_date IS NOT NULL
-                """)
-                is_first_blood = (cursor.fetchone()['death_count'] == 0)
-
-                cursor.execute("""
-                    UPDATE picks
-                    SET age = %s, birth_date = %s, death_date = %s, death_age = %s, points = %s, is_first_blood = %s, description = %s, wikipedia_url = %s
-                    WHERE id = %s
-                """, (result['age'], result['birth_date'], result['death_date'], result['death_age'], points, is_first_blood, result['description'], result['wiki_url'], pick_id))
-
-                print(f"  ✓ Found: Age {result['age']}, Born {result['birth_date']}")
-                print(f"  💀 DECEASED: Died {result['death_date']}, Age {result['death_age']}, {points} points")
-            else:
-                cursor.execute("""
-                    UPDATE picks
-                    SET age = %s, birth_date = %s, description = %s, wikipedia_url = %s
-                    WHERE id = %s
-                """, (result['age'], result['birth_date'], result['description'], result['wiki_url'], pick_id))
-                print(f"  ✓ Found: Age {result['age']}, Born {result['birth_date']}")
-
-            conn.commit()
-            success += 1
-        else:
-            print(f"  ✗ Not found")
-            failed += 1
-
-        # Be nice to Wikipedia - wait between requests
-        if i < total:
-            time.sleep(0.5)
+                print(f"  💀 DECEASED: Died {result['death_date']}, Age {result['death_age']}")
+
+        conn.commit()
 
+    dedup = celebrities.dedup_report(cursor)
     cursor.close()
     conn.close()
 
     print("\n" + "=" * 60)
     print(f"Completed: {success} found, {failed} not found")
+    elapsed = time.monotonic() - started
+    if elapsed > 0:
+        print(f"Throughput: {total / elapsed:.1f} lookups/sec over {elapsed:.1f}s with {concurrency} threads")
+    print(f"Chunk latency (ms): {wiki_client.percentiles(latencies)}")
+    wiki = wiki_client.stats()
+    print(f"Wikipedia: {wiki}")
+    print(f"Transferred: {wiki['bytes_received'] / 1024:.0f} KB, {wiki['bytes_per_lookup']} bytes/lookup; "
+          f"wikitext {wiki['content_bytes'] / 1024:.0f} KB in {wiki['content_requests']} requests "
+          f"({wiki['full_page_fallbacks']} full-page fallbacks), latency (ms) {wiki['content_ms']}")
+    for row in dedup:
+        print(f"Season {row['season_year']}: {row['picks']} picks, {row['spellings']} spellings, "
+              f"{row['names']} distinct names ({row['dedup_ratio']:.0%} of lookups saved)")
 
 if __name__ == '__main__':
     batch_lookup()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Compare infobox.dates with the old per-pattern regex scan over saved wikitext.
+
+Usage: python3 bench_infobox.py [scale] [iterations]
+
+The fixtures in fixtures/wikitext are trimmed articles, so each body is
+repeated ``scale`` times (default 100, 50-110KB) to get the size of a
+real long biography.
+"""
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+import infobox
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'wikitext')
+
+# The lookup code before infobox.py: up to eight re.search(..., re.IGNORECASE)
+# calls over the whole article, with patterns given as string literals
+LEGACY_BIRTH_PATTERNS = [
+    r'birth_date\s*=\s*\{\{(?:birth date and age|birth date)\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
+    r'birth_date\s*=\s*\{\{dob\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
+    r'birth_date\s*=\s*\{\{bda\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
+    r'birth_date\s*=\s*\{\{(?:birth date and age|birth date)\|(?:mf=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
+]
+LEGACY_DEATH_PATTERNS = [
+    r'death_date\s*=\s*\{\{(?:circa\|)?\{\{(?:death date and age|death date)\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
+    r'death_date\s*=\s*\{\{(?:death date and age|death date)\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
+    r'death_date\s*=\s*\{\{dda\|(?:df=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
+    r'death_date\s*=\s*\{\{(?:death date and age|death date)\|(?:mf=yes\|)?(\d{4})\|(\d{1,2})\|(\d{1,2})',
+]
+
+
+def legacy_dates(content):
+    dates = []
+    for patterns in (LEGACY_BIRTH_PATTERNS, LEGACY_DEATH_PATTERNS):
+        found = None
+        for pattern in patterns:
+            match = re.search(pattern, content, re.IGNORECASE)
+            if match:
+                year, month, day = match.groups()
+                found = f"{year}-{int(month):02d}-{int(day):02d}"
+                break
+        dates.append(found)
+        if not dates[0]:
+            return None, None
+    return tuple(dates)
+
+
+def load(scale):
+    articles = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES, '*.wikitext'))):
+        with open(path) as f:
+            text = f.read()
+        # Repeat everything after the lead sentence's paragraph break
+        head, sep, body = text.partition('\n\n')
+        articles[os.path.basename(path)[:-len('.wikitext')]] = head + sep + body * scale
+    return articles
+
+
+def timed(parse, text, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse(text)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    with open(os.path.join(FIXTURES, 'expected.json')) as f:
+        expected = {name: tuple(dates) for name, dates in json.load(f).items()}
+    articles = load(scale)
+
+    print(f"{'fixture':<16} {'KB':>6} {'regex us':>10} {'infobox us':>11} {'speedup':>8}  correct (regex / infobox)")
+    totals = [0.0, 0.0]
+    correct = [0, 0]
+    for name, text in articles.items():
+        old_us = timed(legacy_dates, text, iterations)
+        new_us = timed(infobox.dates, text, iterations)
+        old_ok = legacy_dates(text) == expected[name]
+        new_ok = infobox.dates(text) == expected[name]
+        totals[0] += old_us
+        totals[1] += new_us
+        correct[0] += old_ok
+        correct[1] += new_ok
+        print(f"{name:<16} {len(text) / 1024:>6.1f} {old_us:>10.1f} {new_us:>11.1f} {old_us / new_us:>7.1f}x  "
+              f"{'yes' if old_ok else 'NO'} / {'yes' if new_ok else 'NO'}")
+
+    print(f"{'total':<16} {'':>6} {totals[0]:>10.1f} {totals[1]:>11.1f} {totals[0] / totals[1]:>7.1f}x  "
+          f"{correct[0]}/{len(articles)} / {correct[1]}/{len(articles)}")
+
+
+if __name__ == '__main__':
+    main()
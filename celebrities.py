@@ -0,0 +1,167 @@
+"""One row per real person, shared by every pick of them.
+
+The same person is often picked by several participants, and living picks
+carry over from season to season. Lookup results are stored once in
+``celebrities``, keyed by Wikipedia page id, and copied onto every pick
+that references the row with a single UPDATE, so a death found for one
+pick scores all of them at once.
+
+``celebrity_names`` maps normalized spellings of a name to the row they
+resolved to, so a name that has been looked up once never needs another
+Wikipedia search.
+"""
+import names
+import scoring
+import wiki_client
+
+
+def save(cursor, result):
+    """Insert or refresh a celebrity from a wiki_client lookup result"""
+    cursor.execute("SELECT page_id FROM celebrities WHERE page_id = %s", (result['page_id'],))
+    values = (result['title'], result['birth_date'], result['death_date'],
+              result['wiki_url'], result['description'], result.get('rev_id'), result['page_id'])
+    if cursor.fetchone():
+        cursor.execute("""
+            UPDATE celebrities
+            SET title = %s, birth_date = %s, death_date = %s, wikipedia_url = %s, description = %s, rev_id = %s
+            WHERE page_id = %s
+        """, values)
+    else:
+        cursor.execute("""
+            INSERT INTO celebrities (title, birth_date, death_date, wikipedia_url, description, rev_id, page_id)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, values)
+
+
+def set_revision(cursor, page_id, rev_id):
+    """Record that a celebrity's article was re-read at this revision without new facts"""
+    cursor.execute("UPDATE celebrities SET rev_id = %s WHERE page_id = %s", (rev_id, page_id))
+
+
+def link(cursor, pick_id, page_id):
+    cursor.execute("UPDATE picks SET celebrity_id = %s WHERE id = %s", (page_id, pick_id))
+
+
+def remember_name(cursor, name, page_id):
+    """Record that a spelling of a name resolves to this celebrity"""
+    name_key = names.normalize(name)
+    if not name_key:
+        return
+    cursor.execute("SELECT page_id FROM celebrity_names WHERE name_key = %s", (name_key,))
+    row = cursor.fetchone()
+    if row is None:
+        cursor.execute("INSERT INTO celebrity_names (name_key, page_id) VALUES (%s, %s)", (name_key, page_id))
+    elif row['page_id'] != page_id:
+        cursor.execute("UPDATE celebrity_names SET page_id = %s WHERE name_key = %s", (page_id, name_key))
+
+
+def find_by_name(cursor, name):
+    """The celebrity a spelling of this name already resolved to, or None"""
+    cursor.execute("""
+        SELECT c.page_id, c.title, c.birth_date, c.death_date, c.wikipedia_url, c.description
+        FROM celebrity_names n
+        JOIN celebrities c ON c.page_id = n.page_id
+        WHERE n.name_key = %s
+    """, (names.normalize(name),))
+    return cursor.fetchone()
+
+
+def known_titles(cursor, celebrity_names):
+    """{name: resolved Wikipedia title} for the names the index already knows"""
+    keys = {name: names.normalize(name) for name in celebrity_names}
+    if not keys:
+        return {}
+    placeholders = ', '.join(['%s'] * len(set(keys.values())))
+    cursor.execute(f"""
+        SELECT n.name_key, c.title
+        FROM celebrity_names n
+        JOIN celebrities c ON c.page_id = n.page_id
+        WHERE n.name_key IN ({placeholders})
+    """, tuple(set(keys.values())))
+    titles = {row['name_key']: row['title'] for row in cursor.fetchall()}
+    return {name: titles[key] for name, key in keys.items() if key in titles}
+
+
+def attach(cursor, pick_id, celebrity):
+    """Link a new pick to a known celebrity, copying their birth date, age and description"""
+    birth_date = str(celebrity['birth_date'])[:10]
+    death_date = str(celebrity['death_date'])[:10] if celebrity['death_date'] else None
+    result = wiki_client.build_result(celebrity['title'], celebrity['page_id'], birth_date, death_date,
+                                      celebrity['description'])
+    cursor.execute("""
+        UPDATE picks
+        SET celebrity_id = %s, age = %s, birth_date = %s, wikipedia_url = %s, description = %s
+        WHERE id = %s
+    """, (celebrity['page_id'], result['age'], birth_date, celebrity['wikipedia_url'],
+          celebrity['description'], pick_id))
+
+
+def dedup_report(cursor):
+    """Per season: picks, distinct normalized names, and the share of lookups saved
+
+    Picks without a name_key yet count as distinct names.
+    """
+    cursor.execute("""
+        SELECT season_year, COUNT(*) AS picks,
+               COUNT(DISTINCT celebrity_name) AS spellings,
+               COUNT(DISTINCT name_key)
+                   + SUM(CASE WHEN name_key IS NULL THEN 1 ELSE 0 END) AS names
+        FROM picks
+        GROUP BY season_year
+        ORDER BY season_year
+    """, ())
+    report = cursor.fetchall()
+    for row in report:
+        row['dedup_ratio'] = round(1 - row['names'] / row['picks'], 3) if row['picks'] else 0.0
+    return report
+
+
+def fan_out(cursor, result):
+    """Copy a lookup result onto every pick of that celebrity.
+
+    Birth date, age and description go to all of their picks; a death only
+    scores picks in the season of the year they died (see scoring.py).
+    Picks never linked to the celebrity are linked first when their name_key
+    is a spelling known to resolve to them (celebrity_names).
+    Returns the affected picks (id, participant_id, season_year) so callers
+    can invalidate caches and publish events.
+    """
+    page_id = result['page_id']
+    cursor.execute("""
+        UPDATE picks SET celebrity_id = %s
+        WHERE celebrity_id IS NULL
+          AND name_key IN (SELECT name_key FROM celebrity_names WHERE page_id = %s)
+    """, (page_id, page_id))
+    cursor.execute("""
+        SELECT id, participant_id, season_year, death_date
+        FROM picks
+        WHERE celebrity_id = %s
+        ORDER BY id
+    """, (page_id,))
+    picks = cursor.fetchall()
+    if not picks:
+        return []
+
+    cursor.execute("""
+        UPDATE picks
+        SET age = %s, birth_date = %s, wikipedia_url = %s, description = %s
+        WHERE celebrity_id = %s
+    """, (result['age'], result['birth_date'], result['wiki_url'], result['description'], page_id))
+
+    if result['death_date']:
+        season_year = int(str(result['death_date'])[:4])
+        deaths = [(p['id'], result['death_date']) for p in picks if p['season_year'] == season_year]
+        if deaths:
+            scoring.score_deaths(cursor, season_year, deaths)
+
+    return [{'id': p['id'], 'participant_id': p['participant_id'], 'season_year': p['season_year']} for p in picks]
+
+
+def apply(cursor, pick_id, result, name=None):
+    """Store a lookup result for a pick and fan it out to every pick of the same person"""
+    save(cursor, result)
+    link(cursor, pick_id, result['page_id'])
+    remember_name(cursor, result['title'], result['page_id'])
+    if name:
+        remember_name(cursor, name, result['page_id'])
+    return fan_out(cursor, result)
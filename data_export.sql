@@ -13,17 +13,17 @@ INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_d
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (2, 1, 'Michael J. Fox', 2025, 64, '1961-06-09', 'https://en.wikipedia.org/wiki/Michael_J._Fox', 'Canadian-American actor and activist (born 1961)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (3, 1, 'Phil Collins', 2025, 75, '1951-01-30', 'https://en.wikipedia.org/wiki/Phil_Collins', 'English musician (born 1951)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (4, 1, 'Willie Nelson', 2025, 92, '1933-04-29', 'https://en.wikipedia.org/wiki/Willie_Nelson', 'American country musician (born 1933)');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, wikipedia_url, description) VALUES (5, 1, 'Ozzy Osbourne', 2025, 76, '1948-12-03', '2025-07-22', 76, 24, 'https://en.wikipedia.org/wiki/Ozzy_Osbourne', 'English musician and media personality (1948–2025)');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, wikipedia_url, description) VALUES (5, 1, 'Ozzy Osbourne', 2025, 76, '1948-12-03', '2025-07-22', 'https://en.wikipedia.org/wiki/Ozzy_Osbourne', 'English musician and media personality (1948–2025)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (6, 1, 'Volodymyr Zelensky', 2025, 48, '1978-01-25', 'https://en.wikipedia.org/wiki/Volodymyr_Zelenskyy', 'President of Ukraine since 2019');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (7, 1, 'Liza Minnelli', 2025, 79, '1946-03-12', 'https://en.wikipedia.org/wiki/Liza_Minnelli', 'American actress, singer, and dancer (born 1946)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (8, 1, 'Kanye West', 2025, 48, '1977-06-08', 'https://en.wikipedia.org/wiki/Kanye_West', 'American rapper and producer (born 1977)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (9, 1, 'Bill Murray', 2025, 75, '1950-09-21', 'https://en.wikipedia.org/wiki/Bill_Murray', 'American actor and comedian (born 1950)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (10, 1, 'Iggy Pop', 2025, 78, '1947-04-21', 'https://en.wikipedia.org/wiki/Iggy_Pop', 'American rock musician (born 1947)');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, wikipedia_url, description) VALUES (11, 1, 'Val Kilmer', 2025, 65, '1959-12-31', '2025-04-01', 65, 35, 'https://en.wikipedia.org/wiki/Val_Kilmer', 'American actor (1959–2025)');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, wikipedia_url, description) VALUES (12, 1, 'Dick Cheney', 2025, 84, '1941-01-30', '2025-11-03', 84, 16, 'https://en.wikipedia.org/wiki/Dick_Cheney', 'Vice President of the United States from 2001 to 2009');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, wikipedia_url, description) VALUES (11, 1, 'Val Kilmer', 2025, 65, '1959-12-31', '2025-04-01', 'https://en.wikipedia.org/wiki/Val_Kilmer', 'American actor (1959–2025)');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, wikipedia_url, description) VALUES (12, 1, 'Dick Cheney', 2025, 84, '1941-01-30', '2025-11-03', 'https://en.wikipedia.org/wiki/Dick_Cheney', 'Vice President of the United States from 2001 to 2009');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (13, 1, 'Nicole Eggert', 2025, 54, '1972-01-13', 'https://en.wikipedia.org/wiki/Nicole_Eggert', 'American actress (born 1972)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (14, 1, 'Paul Simon', 2025, 84, '1941-10-13', 'https://en.wikipedia.org/wiki/Paul_Simon', 'American singer-songwriter (born 1941)');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, is_first_blood, wikipedia_url, description) VALUES (15, 1, 'Ananda Lewis', 2025, 52, '1973-03-21', '2025-06-11', 52, 48, 1, 'https://en.wikipedia.org/wiki/Ananda_Lewis', 'American broadcast journalist, television host and social activist (1973–2025)');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, is_first_blood, wikipedia_url, description) VALUES (15, 1, 'Ananda Lewis', 2025, 52, '1973-03-21', '2025-06-11', 1, 'https://en.wikipedia.org/wiki/Ananda_Lewis', 'American broadcast journalist, television host and social activist (1973–2025)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (16, 1, 'Sally Struthers', 2025, 78, '1947-07-28', 'https://en.wikipedia.org/wiki/Sally_Struthers', 'American actress and activist (born 1947)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (17, 1, 'Ray Davies', 2025, 81, '1944-06-21', 'https://en.wikipedia.org/wiki/Ray_Davies', 'English musician (born 1944)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (18, 1, 'Robert Wagner', 2025, 95, '1930-02-10', 'https://en.wikipedia.org/wiki/Robert_Wagner', 'American actor (born 1930)');
@@ -33,7 +33,7 @@ INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_d
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (22, 1, 'Chris Evert', 2025, 71, '1954-12-21', 'https://en.wikipedia.org/wiki/Chris_Evert', 'American former tennis player (born 1954)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (23, 1, 'Bruce Willis', 2025, 70, '1955-03-19', 'https://en.wikipedia.org/wiki/Bruce_Willis', 'American actor (born 1955)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (24, 1, 'Ariana Grande', 2025, 32, '1993-06-26', 'https://en.wikipedia.org/wiki/Ariana_Grande', 'American singer and actress (born 1993)');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, wikipedia_url, description) VALUES (25, 1, 'Jimmy Swaggart', 2025, 90, '1935-03-15', '2025-07-01', 90, 10, 'https://en.wikipedia.org/wiki/Jimmy_Swaggart', 'American television evangelist (1935–2025)');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, wikipedia_url, description) VALUES (25, 1, 'Jimmy Swaggart', 2025, 90, '1935-03-15', '2025-07-01', 'https://en.wikipedia.org/wiki/Jimmy_Swaggart', 'American television evangelist (1935–2025)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (26, 1, 'Christina Applegate', 2025, 54, '1971-11-25', 'https://en.wikipedia.org/wiki/Christina_Applegate', 'American actress (born 1971)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (27, 1, 'Lloyd Austin', 2025, 72, '1953-08-08', 'https://en.wikipedia.org/wiki/Lloyd_Austin', 'American general (born 1953)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (28, 1, 'Sarah Ferguson', 2025, 66, '1959-10-15', 'https://en.wikipedia.org/wiki/Sarah_Ferguson', 'British author and former royal (born 1959)');
@@ -49,10 +49,10 @@ INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_d
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (38, 1, 'Gary Busey', 2025, 81, '1944-06-29', 'https://en.wikipedia.org/wiki/Gary_Busey', 'American actor (born 1944)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (39, 1, 'Mitch McConnell', 2025, 83, '1942-02-20', 'https://en.wikipedia.org/wiki/Mitch_McConnell', 'American politician and attorney (born 1942)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (40, 1, 'Will Shortz', 2025, 73, '1952-08-26', 'https://en.wikipedia.org/wiki/Will_Shortz', 'American puzzle creator and editor (born 1952)');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, wikipedia_url, description) VALUES (41, 1, 'Brian Wilson', 2025, 82, '1942-06-20', '2025-06-11', 82, 18, 'https://en.wikipedia.org/wiki/Brian_Wilson', 'American musician (1942–2025)');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, wikipedia_url, description) VALUES (41, 1, 'Brian Wilson', 2025, 82, '1942-06-20', '2025-06-11', 'https://en.wikipedia.org/wiki/Brian_Wilson', 'American musician (1942–2025)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (42, 1, 'King Charles III', 2025, 77, '1948-11-14', 'https://en.wikipedia.org/wiki/Charles_III', 'King of the United Kingdom since 2022');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (43, 1, 'Bam Margera', 2025, 46, '1979-09-28', 'https://en.wikipedia.org/wiki/Bam_Margera', 'American skateboarder and stuntman (born 1979)');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, wikipedia_url, description) VALUES (44, 1, 'Wink Martindale', 2025, 91, '1933-12-04', '2025-04-15', 91, 9, 'https://en.wikipedia.org/wiki/Wink_Martindale', 'American DJ and television personality (1933–2025)');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, wikipedia_url, description) VALUES (44, 1, 'Wink Martindale', 2025, 91, '1933-12-04', '2025-04-15', 'https://en.wikipedia.org/wiki/Wink_Martindale', 'American DJ and television personality (1933–2025)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (45, 1, 'Justine Bateman', 2025, 59, '1966-02-19', 'https://en.wikipedia.org/wiki/Justine_Bateman', 'American filmmaker and author (born 1966)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (46, 1, 'Stevie Wonder', 2025, 75, '1950-05-13', 'https://en.wikipedia.org/wiki/Stevie_Wonder', 'American musician (born 1950)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (47, 1, 'Tom Brokaw', 2025, 85, '1940-02-06', 'https://en.wikipedia.org/wiki/Tom_Brokaw', 'American broadcast journalist and author (born 1940)');
@@ -65,7 +65,7 @@ INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_d
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (54, 2, 'Bianca Censori', 2025, 31, '1995-01-05', 'https://en.wikipedia.org/wiki/Bianca_Censori', 'Australian architect and model (born 1995)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (55, 2, 'Steve Bannon', 2025, 72, '1953-11-27', 'https://en.wikipedia.org/wiki/Steve_Bannon', 'American media executive and political strategist (born 1953)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (56, 2, 'Mel Brooks', 2025, 99, '1926-06-28', 'https://en.wikipedia.org/wiki/Mel_Brooks', 'American filmmaker, actor, comedian, and songwriter (born 1926)');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, wikipedia_url, description) VALUES (57, 2, 'Gene Hackman', 2025, 95, '1930-01-30', '2025-02-18', 95, 5, 'https://en.wikipedia.org/wiki/Gene_Hackman', 'American actor (1930–2025)');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, wikipedia_url, description) VALUES (57, 2, 'Gene Hackman', 2025, 95, '1930-01-30', '2025-02-18', 'https://en.wikipedia.org/wiki/Gene_Hackman', 'American actor (1930–2025)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (58, 2, 'Chuck Grassley', 2025, 92, '1933-09-17', 'https://en.wikipedia.org/wiki/Chuck_Grassley', 'American politician (born 1933)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (59, 2, 'Justin Bieber', 2025, 31, '1994-03-01', 'https://en.wikipedia.org/wiki/Justin_Bieber', 'Canadian singer (born 1994)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (60, 2, 'Dick Van Dyke', 2025, 100, '1925-12-13', 'https://en.wikipedia.org/wiki/Dick_Van_Dyke', 'American actor and comedian (born 1925)');
@@ -77,7 +77,7 @@ INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_d
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (66, 2, 'Cyndi Lauper', 2025, 72, '1953-06-22', 'https://en.wikipedia.org/wiki/Cyndi_Lauper', 'American singer-songwriter and actress (born 1953)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (67, 2, 'Billy Idol', 2025, 70, '1955-11-30', 'https://en.wikipedia.org/wiki/Billy_Idol', 'English singer (born 1955)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (68, 2, 'Celine Dion', 2025, 57, '1968-03-30', 'https://en.wikipedia.org/wiki/Celine_Dion', 'Canadian singer (born 1968)');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, wikipedia_url, description) VALUES (69, 2, 'Steve McMichael', 2025, 67, '1957-10-17', '2025-04-23', 67, 33, 'https://en.wikipedia.org/wiki/Steve_McMichael', 'American football player and professional wrestler (1957–2025)');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, wikipedia_url, description) VALUES (69, 2, 'Steve McMichael', 2025, 67, '1957-10-17', '2025-04-23', 'https://en.wikipedia.org/wiki/Steve_McMichael', 'American football player and professional wrestler (1957–2025)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (70, 2, 'Christina Applegate', 2025, 54, '1971-11-25', 'https://en.wikipedia.org/wiki/Christina_Applegate', 'American actress (born 1971)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (71, 2, 'Ian McKellen', 2025, 86, '1939-05-25', 'https://en.wikipedia.org/wiki/Ian_McKellen', 'English actor (born 1939)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (72, 2, 'Johnny Depp', 2025, 62, '1963-06-09', 'https://en.wikipedia.org/wiki/Johnny_Depp', 'American actor (born 1963)');
@@ -92,7 +92,7 @@ INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_d
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (81, 2, 'Hunter Biden', 2025, 55, '1970-02-04', 'https://en.wikipedia.org/wiki/Hunter_Biden', 'American businessman and lobbyist (born 1970)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (82, 2, 'Laura Loomer', 2025, 32, '1993-05-21', 'https://en.wikipedia.org/wiki/Laura_Loomer', 'American political activist (born 1993)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (83, 2, 'Elton John', 2025, 78, '1947-03-25', 'https://en.wikipedia.org/wiki/Elton_John', 'British musician and songwriter (born 1947)');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, wikipedia_url, description) VALUES (84, 2, 'Pope Francis', 2025, 88, '1936-12-17', '2025-04-21', 88, 12, 'https://en.wikipedia.org/wiki/Pope_Francis', 'Head of the Catholic Church from 2013 to 2025');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, wikipedia_url, description) VALUES (84, 2, 'Pope Francis', 2025, 88, '1936-12-17', '2025-04-21', 'https://en.wikipedia.org/wiki/Pope_Francis', 'Head of the Catholic Church from 2013 to 2025');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (85, 2, 'Donald Trump', 2025, 79, '1946-06-14', 'https://en.wikipedia.org/wiki/Donald_Trump', 'President of the United States (2017–2021; since 2025)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date) VALUES (86, 2, 'Shakira', 2025, 28, '1997-02-02');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (87, 2, 'Phil Collins', 2025, 75, '1951-01-30', 'https://en.wikipedia.org/wiki/Phil_Collins', 'English musician (born 1951)');
@@ -108,7 +108,7 @@ INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_d
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (97, 2, 'John Elway', 2025, 65, '1960-06-28', 'https://en.wikipedia.org/wiki/John_Elway', 'American football player and executive (born 1960)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (98, 2, 'Randy Moss', 2025, 48, '1977-02-13', 'https://en.wikipedia.org/wiki/Randy_Moss', 'American football player and commentator (born 1977)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (99, 2, 'Bill Clinton', 2025, 79, '1946-08-19', 'https://en.wikipedia.org/wiki/Bill_Clinton', 'President of the United States from 1993 to 2001');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, wikipedia_url, description) VALUES (100, 2, 'Hulk Hogan', 2025, 71, '1953-08-11', '2025-07-24', 71, 29, 'https://en.wikipedia.org/wiki/Hulk_Hogan', 'American professional wrestler (1953–2025)');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, wikipedia_url, description) VALUES (100, 2, 'Hulk Hogan', 2025, 71, '1953-08-11', '2025-07-24', 'https://en.wikipedia.org/wiki/Hulk_Hogan', 'American professional wrestler (1953–2025)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (101, 3, 'Rupert Murdoch', 2025, 94, '1931-03-11', 'https://en.wikipedia.org/wiki/Rupert_Murdoch', 'Australian and American business magnate (born 1931)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (102, 3, 'Justin Bieber', 2025, 31, '1994-03-01', 'https://en.wikipedia.org/wiki/Justin_Bieber', 'Canadian singer (born 1994)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (103, 3, 'Alan Alda', 2025, 90, '1936-01-28', 'https://en.wikipedia.org/wiki/Alan_Alda', 'American actor (born 1936)');
@@ -126,7 +126,7 @@ INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_d
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (115, 3, 'Willie Nelson', 2025, 92, '1933-04-29', 'https://en.wikipedia.org/wiki/Willie_Nelson', 'American country musician (born 1933)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (116, 3, 'Harrison Ford', 2025, 83, '1942-07-13', 'https://en.wikipedia.org/wiki/Harrison_Ford', 'American actor (born 1942)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (117, 3, 'Harvey Weinstein', 2025, 73, '1952-03-19', 'https://en.wikipedia.org/wiki/Harvey_Weinstein', 'American film producer and sex offender (born 1952)');
-INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, death_age, points, wikipedia_url, description) VALUES (118, 3, 'Gene Hackman', 2025, 95, '1930-01-30', '2025-02-18', 95, 5, 'https://en.wikipedia.org/wiki/Gene_Hackman', 'American actor (1930–2025)');
+INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, death_date, wikipedia_url, description) VALUES (118, 3, 'Gene Hackman', 2025, 95, '1930-01-30', '2025-02-18', 'https://en.wikipedia.org/wiki/Gene_Hackman', 'American actor (1930–2025)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date) VALUES (119, 3, 'Cara Delevingne', 2025, 33, '1992-08-12');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (120, 3, 'Robert Plant', 2025, 77, '1948-08-20', 'https://en.wikipedia.org/wiki/Robert_Plant', 'English singer (born 1948)');
 INSERT INTO picks (id, participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url, description) VALUES (121, 3, 'Jon Voight', 2025, 87, '1938-12-29', 'https://en.wikipedia.org/wiki/Jon_Voight', 'American actor (born 1938)');
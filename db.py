@@ -0,0 +1,435 @@
+"""Database access for the Deathpool app and scripts.
+
+DB_BACKEND selects MySQL (``mysql``, the default) or SQLite (``sqlite``,
+the file at DB_PATH). Everything else is written once: queries use ``%s``
+placeholders and ``conn.cursor(dictionary=True)`` returns rows as dicts on
+either backend, with the SQLite adapter translating to its own paramstyle.
+MySQL connections come from a bounded pool. SQLite connections are kept
+in a shared idle list and reused by any thread or greenlet, in WAL mode so
+readers never wait on a writer; handlers that write ask for
+``get_db_connection(write=True)``.
+
+Bulk writes should use ``cursor.executemany``. For big reads, ``stream``
+yields rows without loading them all.
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import date, datetime
+from functools import lru_cache
+
+DB_BACKEND = os.environ.get('DB_BACKEND', 'mysql')
+DB_PATH = os.environ.get('DB_PATH', 'deathpool.db')
+
+# MySQL configuration
+DB_CONFIG = {
+    'host':     os.environ.get('DB_HOST', 'localhost'),
+    'user':     os.environ.get('DB_USER', 'root'),
+    'password': os.environ.get('DB_PASSWORD', ''),
+    'database': os.environ.get('DB_NAME', 'deathpool'),
+}
+
+# Pool sizing - tune these under load using the numbers from pool.stats()
+POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 10))      # seconds to wait for a free connection
+POOL_MAX_IDLE = float(os.environ.get('DB_POOL_MAX_IDLE', 300))   # close connections idle longer than this
+POOL_PING_AFTER = float(os.environ.get('DB_POOL_PING_AFTER', 30))  # health check connections idle longer than this
+STREAM_BATCH = 500  # rows fetched at a time by stream()
+
+# SQLite tuning, applied to every connection
+SQLITE_CACHE_MB = int(os.environ.get('DB_SQLITE_CACHE_MB', 64))         # page cache per connection
+SQLITE_MMAP_MB = int(os.environ.get('DB_SQLITE_MMAP_MB', 256))          # database file mapped into memory
+SQLITE_BUSY_TIMEOUT = int(os.environ.get('DB_SQLITE_BUSY_TIMEOUT', 5000))  # ms a writer waits for the write lock
+SQLITE_KEEP = int(os.environ.get('DB_SQLITE_KEEP', 8))                  # idle connections kept for reuse
+SQLITE_PRAGMAS = (
+    "journal_mode = WAL",    # readers see a snapshot while one writer appends to the log
+    "synchronous = NORMAL",  # fsync at checkpoints rather than every commit; safe with WAL
+    f"cache_size = -{SQLITE_CACHE_MB * 1024}",
+    f"mmap_size = {SQLITE_MMAP_MB * 1024 * 1024}",
+    f"busy_timeout = {SQLITE_BUSY_TIMEOUT}",
+    "foreign_keys = ON",
+)
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes free within the checkout timeout"""
+
+
+class ConnectionPool:
+    """Bounded pool of reusable database connections.
+
+    Connections are opened lazily up to ``size``. A connection that has sat
+    idle for more than ``ping_after`` seconds is health checked before it is
+    handed out, and one idle for more than ``max_idle`` seconds is closed.
+    """
+
+    def __init__(self, connect, ping, size=POOL_SIZE, timeout=POOL_TIMEOUT,
+                 max_idle=POOL_MAX_IDLE, ping_after=POOL_PING_AFTER):
+        self._connect = connect
+        self._ping = ping
+        self.size = size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.ping_after = ping_after
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # (conn, last_used), most recently used on the right
+        self._open = 0
+        self._in_use = 0
+
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._created = 0
+        self._discarded = 0
+        self._latencies = deque(maxlen=1000)  # recent checkout latencies in seconds
+
+    def _evict_idle(self, now):
+        """Pop connections idle longer than max_idle; caller holds the lock"""
+        stale = []
+        while self._idle and now - self._idle[0][1] > self.max_idle:
+            stale.append(self._idle.popleft()[0])
+            self._open -= 1
+            self._discarded += 1
+        return stale
+
+    def acquire(self):
+        start = time.monotonic()
+        deadline = start + self.timeout
+        conn = None
+        last_used = None
+        waited = False
+
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                stale = self._evict_idle(now)
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    self._open += 1
+                    break
+                remaining = deadline - now
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout(f"No database connection free after {self.timeout}s")
+                if not waited:
+                    waited = True
+                    self._waits += 1
+                self._cond.wait(remaining)
+            self._in_use += 1
+
+        for stale_conn in stale:
+            _close_quietly(stale_conn)
+
+        try:
+            if conn is not None and time.monotonic() - last_used > self.ping_after and not self._ping(conn):
+                _close_quietly(conn)
+                conn = None
+                with self._cond:
+                    self._discarded += 1
+            if conn is None:
+                conn = self._connect()
+                with self._cond:
+                    self._created += 1
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._checkouts += 1
+            self._latencies.append(time.monotonic() - start)
+        return conn
+
+    def release(self, conn):
+        # Never hand the next request an open transaction (or a stale snapshot)
+        try:
+            conn.rollback()
+            healthy = True
+        except Exception:
+            healthy = False
+            _close_quietly(conn)
+
+        with self._cond:
+            self._in_use -= 1
+            if healthy:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._open -= 1
+                self._discarded += 1
+            self._cond.notify()
+
+    def stats(self):
+        with self._cond:
+            latencies = sorted(self._latencies)
+            return {
+                'size': self.size,
+                'open': self._open,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'checkouts': self._checkouts,
+                'waits': self._waits,
+                'timeouts': self._timeouts,
+                'created': self._created,
+                'discarded': self._discarded,
+                'checkout_ms': {
+                    'avg': round(sum(latencies) / len(latencies) * 1000, 3) if latencies else None,
+                    'p95': round(latencies[int(len(latencies) * 0.95)] * 1000, 3) if latencies else None,
+                    'max': round(latencies[-1] * 1000, 3) if latencies else None,
+                },
+            }
+
+
+class SharedConnections:
+    """Open SQLite connections kept for reuse across requests.
+
+    Opening a SQLite connection is cheap but throws away its page cache and
+    prepared statements, so released connections wait in one idle list that
+    every thread and greenlet takes from. Each checkout has its connection
+    to itself; when none is idle a new one is opened, since SQLite readers
+    never block each other. Up to ``keep`` idle connections are kept and
+    the rest closed, so a burst of requests doesn't leave them all open.
+    """
+
+    def __init__(self, connect, keep=SQLITE_KEEP):
+        self._connect = connect
+        self._keep = keep
+        self._lock = threading.Lock()
+        self._idle = []
+        self._open = 0
+        self._in_use = 0
+        self._checkouts = 0
+        self._created = 0
+        self._discarded = 0
+
+    def acquire(self):
+        with self._lock:
+            self._in_use += 1
+            self._checkouts += 1
+            if self._idle:
+                return self._idle.pop()
+        try:
+            conn = self._connect()
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+            raise
+        with self._lock:
+            self._open += 1
+            self._created += 1
+        return conn
+
+    def release(self, conn):
+        try:
+            conn.rollback()
+            healthy = True
+        except Exception:
+            healthy = False
+        with self._lock:
+            self._in_use -= 1
+            if healthy and len(self._idle) < self._keep:
+                self._idle.append(conn)
+                return
+            self._open -= 1
+            if not healthy:
+                self._discarded += 1
+        _close_quietly(conn)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'shared': True,
+                'open': self._open,
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                'checkouts': self._checkouts,
+                'created': self._created,
+                'discarded': self._discarded,
+            }
+
+
+def _close_quietly(conn):
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def as_datetime(value):
+    """A DATETIME value as a datetime, from either backend or as stored text"""
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, bytes):
+        value = value.decode()
+    return datetime.fromisoformat(str(value))
+
+
+# SQLite stores dates as text; hand DATE and DATETIME columns back as date and
+# datetime objects, as mysql.connector does, and store them in the same format
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_converter('DATE', lambda value: date.fromisoformat(value.decode()[:10]))
+sqlite3.register_converter('DATETIME', as_datetime)
+
+
+_FOR_UPDATE = re.compile(r'\s+FOR UPDATE\b')
+
+
+@lru_cache(maxsize=512)
+def _qmark(query):
+    # SQLite has a single writer, so row locks (FOR UPDATE) have nothing to add there
+    return _FOR_UPDATE.sub('', query.replace('%s', '?'))
+
+
+def _dict_row(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+class SQLiteCursor:
+    """A sqlite3 cursor that takes %s placeholders, like mysql.connector's"""
+
+    def __init__(self, cursor, dictionary=False):
+        self._cursor = cursor
+        if dictionary:
+            cursor.row_factory = _dict_row
+
+    def execute(self, query, params=()):
+        self._cursor.execute(_qmark(query), params)
+        return self
+
+    def executemany(self, query, seq_params):
+        self._cursor.executemany(_qmark(query), seq_params)
+        return self
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchmany(self, size=STREAM_BATCH):
+        return self._cursor.fetchmany(size)
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """A sqlite3 connection with the parts of mysql.connector's interface the app uses"""
+
+    def __init__(self, path):
+        # Used by one thread at a time, but a script may hand it between threads
+        self._conn = sqlite3.connect(path, timeout=SQLITE_BUSY_TIMEOUT / 1000, check_same_thread=False,
+                                     cached_statements=512, detect_types=sqlite3.PARSE_DECLTYPES)
+        for pragma in SQLITE_PRAGMAS:
+            self._conn.execute(f"PRAGMA {pragma}")
+
+    def cursor(self, dictionary=False, buffered=None):
+        # Every sqlite3 statement is prepared and cached per connection, and results
+        # are always read from the database file as they're fetched
+        return SQLiteCursor(self._conn.cursor(), dictionary)
+
+    def begin_immediate(self):
+        """Start a transaction holding the write lock, waiting up to busy_timeout for it"""
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        self._conn.close()
+
+    def is_connected(self):
+        try:
+            self._conn.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+
+def _connect_mysql():
+    import mysql.connector  # only needed, and only installed, for the MySQL backend
+    # consume_results lets a connection go back to the pool after a partial fetchone()
+    return mysql.connector.connect(consume_results=True, **DB_CONFIG)
+
+
+def _connect_sqlite():
+    return SQLiteConnection(DB_PATH)
+
+
+def connect(backend=None):
+    """A new connection to DB_BACKEND, or ``backend``, outside the pool (for scripts)"""
+    backend = backend or DB_BACKEND
+    if backend == 'sqlite':
+        return _connect_sqlite()
+    if backend == 'mysql':
+        return _connect_mysql()
+    raise ValueError(f"Unknown DB_BACKEND: {backend}")
+
+
+if DB_BACKEND == 'sqlite':
+    pool = SharedConnections(connect=connect)
+else:
+    pool = ConnectionPool(connect=connect, ping=lambda conn: conn.is_connected())
+
+
+@contextmanager
+def get_db_connection(write=False):
+    """Context manager for database connections.
+
+    ``write=True`` is for handlers that read and then write. On SQLite it
+    starts the transaction with BEGIN IMMEDIATE, so the handler's reads and
+    writes happen under one write lock instead of failing to upgrade a read
+    lock halfway through. Readers carry on from their WAL snapshot meanwhile.
+    """
+    conn = pool.acquire()
+    try:
+        if write and isinstance(conn, SQLiteConnection):
+            conn.begin_immediate()
+        yield conn
+    finally:
+        pool.release(conn)
+
+
+def stream(conn, query, params=(), size=STREAM_BATCH):
+    """Yield dict rows of a big read ``size`` at a time instead of all at once.
+
+    MySQL uses an unbuffered cursor, so rows stay on the server until
+    fetched; don't run other statements on ``conn`` until the loop is done.
+    """
+    cursor = conn.cursor(dictionary=True, buffered=False)
+    try:
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(size)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        cursor.close()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Incremental death watch for a season's living picks.
+
+Usage: python3 death_watch.py [season_year]
+
+Each celebrity row remembers the revision id of the article its facts were
+read from. A run asks Wikipedia for the current revision of every living
+pick's article, 50 page ids per request, and re-reads only the articles
+that have been edited since. When nothing happened, a full season costs
+one or two of those requests. Changes are fanned out to every pick of the
+person, and dashboards are notified as for any other write.
+
+Run it from cron as often as you like; picks not linked to a celebrity
+yet need a batch_lookup_ages run first.
+"""
+import sys
+import time
+from datetime import datetime
+
+import celebrities
+import events
+import season_cache
+import wiki_client
+from db import get_db_connection
+
+
+def living_celebrities(cursor, season_year):
+    """{page_id: last seen rev_id} for the celebrities behind a season's living picks"""
+    cursor.execute("""
+        SELECT DISTINCT c.page_id, c.rev_id
+        FROM picks p
+        JOIN celebrities c ON c.page_id = p.celebrity_id
+        WHERE p.season_year = %s AND p.death_date IS NULL
+    """, (season_year,))
+    return {row['page_id']: row['rev_id'] for row in cursor.fetchall()}
+
+
+def refresh(season_year, backend=None):
+    """Re-read the living picks' articles that changed; returns (checked, changed, deaths)"""
+    started = time.monotonic()
+    requests_before = wiki_client.stats()['requests']
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        seen = living_celebrities(cursor, season_year)
+        cursor.execute("""
+            SELECT COUNT(*) AS unlinked FROM picks
+            WHERE season_year = %s AND death_date IS NULL AND celebrity_id IS NULL
+        """, (season_year,))
+        unlinked = cursor.fetchone()['unlinked']
+
+    # No database connection is held while we wait on Wikipedia
+    current = wiki_client.current_revisions(seen)
+    changed = [page for page_id, page in current.items() if page['rev_id'] != seen[page_id]]
+    results = wiki_client.lookup_pages(changed, backend)
+
+    deaths = []
+    with get_db_connection(write=True) as conn:
+        cursor = conn.cursor(dictionary=True)
+        affected = []
+        for page in changed:
+            result = results[page['page_id']]
+            if not result:
+                # Infobox gone or unreadable in this revision; keep what we had
+                celebrities.set_revision(cursor, page['page_id'], page['rev_id'])
+                continue
+            celebrities.save(cursor, result)
+            affected += celebrities.fan_out(cursor, result)
+            if result['death_date']:
+                deaths.append(result)
+        for year in sorted({pick['season_year'] for pick in affected}):
+            season_cache.bump_version(cursor, year)
+            events.publish_pick_changes(cursor, year, [pick['id'] for pick in affected if pick['season_year'] == year])
+        conn.commit()
+
+    requests = wiki_client.stats()['requests'] - requests_before
+    print(f"Season {season_year}: checked {len(seen)} living celebrities, {len(changed)} articles edited, "
+          f"{len(deaths)} deceased, {requests} requests in {time.monotonic() - started:.1f}s")
+    for missing in set(seen) - set(current):
+        print(f"  ? page {missing} no longer exists on Wikipedia")
+    for result in deaths:
+        print(f"  💀 {result['title']}: Died {result['death_date']}, Age {result['death_age']}")
+    if unlinked:
+        print(f"  {unlinked} living picks aren't linked to a celebrity yet; run batch_lookup_ages first")
+    return len(seen), len(changed), len(deaths)
+
+
+if __name__ == '__main__':
+    refresh(int(sys.argv[1]) if len(sys.argv) > 1 else datetime.now().year)
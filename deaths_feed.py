@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Score deaths from one list of recent deaths instead of a lookup per pick.
+
+Usage: python3 deaths_feed.py <year | deaths.json | deaths.csv>
+
+With a year, the twelve "Deaths in <Month> <year>" pages that make up
+Wikipedia's "Deaths in <year>" list are fetched in a single request and
+parsed. A JSON file holds a list of {"name", "death_date"} objects and a
+CSV file has name and death_date columns; both may add "title" (the
+Wikipedia article) and "age".
+
+Every living pick, in every season, is loaded once and the list is hash
+joined against it in memory. Picks linked to a celebrity match on that
+celebrity's article title or on a spelling ``celebrity_names`` resolved to
+it, so "Chris Evans" the presenter can't kill "Chris Evans" the actor.
+Unlinked picks match on their normalized name. A death scores the matched
+picks in the season of the year it happened, and all of them are written
+in one transaction.
+"""
+import csv
+import json
+import re
+import sys
+from datetime import date, datetime
+
+import events
+import names
+import scoring
+import season_cache
+import wiki_client
+from db import get_db_connection, stream
+
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+               'August', 'September', 'October', 'November', 'December']
+
+_DAY = re.compile(r'^=+\s*(\d{1,2})\s*=+\s*$')
+_ENTRY = re.compile(r'^\*\s*\[\[([^\]|#]+)(?:\|([^\]]+))?\]\]\s*,\s*(\d{1,3})?')
+
+
+def parse_deaths_page(text, year, month):
+    """Entries ({name, title, death_date, age}) from a "Deaths in <Month> <year>" page"""
+    entries = []
+    day = None
+    for line in text.splitlines():
+        heading = _DAY.match(line)
+        if heading:
+            day = int(heading.group(1))
+            continue
+        match = _ENTRY.match(line)
+        if not match or day is None:
+            continue
+        try:
+            death_date = date(year, month, day).isoformat()
+        except ValueError:
+            continue
+        title = match.group(1).strip()
+        entries.append({
+            'name': (match.group(2) or title).strip(),
+            'title': title,
+            'death_date': death_date,
+            'age': int(match.group(3)) if match.group(3) else None,
+        })
+    return entries
+
+
+def fetch_year(year):
+    """Entries for every month of a year so far, in one API request"""
+    months = MONTH_NAMES[:datetime.now().month] if year == datetime.now().year else MONTH_NAMES
+    titles = [f'Deaths in {month} {year}' for month in months]
+    pages, resolved = wiki_client.query_titles(titles, content=True, prop='revisions',
+                                               rvprop='content', rvslots='main')
+    entries = []
+    for number, title in enumerate(titles, 1):
+        page = pages.get(resolved[title])
+        if page and 'revisions' in page:
+            entries += parse_deaths_page(page['revisions'][0]['slots']['main']['*'], year, number)
+    return entries
+
+
+def read_file(path):
+    """Entries from a JSON list or a CSV file with name and death_date columns"""
+    with open(path, newline='') as f:
+        rows = json.load(f) if path.endswith('.json') else list(csv.DictReader(f))
+    entries = []
+    for row in rows:
+        age = row.get('age')
+        entries.append({
+            'name': row['name'],
+            'title': row.get('title') or None,
+            'death_date': str(row['death_date'])[:10],
+            'age': int(age) if age not in (None, '') else None,
+        })
+    return entries
+
+
+def living_picks(conn):
+    """Every pick without a death, with the title of its celebrity if it has one, streamed"""
+    return stream(conn, """
+        SELECT p.id, p.participant_id, p.season_year, p.celebrity_name, p.name_key,
+               p.birth_date, p.celebrity_id, c.title
+        FROM picks p
+        LEFT JOIN celebrities c ON c.page_id = p.celebrity_id
+        WHERE p.death_date IS NULL
+    """)
+
+
+def match(conn, entries):
+    """[(entry, pick)] for the living picks each entry refers to"""
+    by_page = {}
+    by_title = {}
+    by_key = {}
+    for pick in living_picks(conn):
+        if pick['celebrity_id']:
+            by_page.setdefault(pick['celebrity_id'], []).append(pick)
+            by_title[pick['title']] = pick['celebrity_id']
+        else:
+            by_key.setdefault(pick['name_key'] or names.normalize(pick['celebrity_name']), []).append(pick)
+
+    keys = {names.normalize(entry[field]) for entry in entries for field in ('name', 'title') if entry[field]}
+    known = {}
+    if keys and by_page:
+        cursor = conn.cursor(dictionary=True)
+        placeholders = ', '.join(['%s'] * len(keys))
+        cursor.execute(f"SELECT name_key, page_id FROM celebrity_names WHERE name_key IN ({placeholders})",
+                       tuple(keys))
+        known = {row['name_key']: row['page_id'] for row in cursor.fetchall()}
+
+    matches = []
+    for entry in entries:
+        entry_keys = {names.normalize(entry[field]) for field in ('name', 'title') if entry[field]}
+        page_ids = {known[key] for key in entry_keys if key in known}
+        if entry['title'] in by_title:
+            page_ids.add(by_title[entry['title']])
+        matched = [pick for page_id in page_ids for pick in by_page.get(page_id, [])]
+        matched += [pick for key in entry_keys for pick in by_key.get(key, [])]
+        matches += [(entry, pick) for pick in {pick['id']: pick for pick in matched}.values()]
+    return matches
+
+
+def apply(cursor, matches):
+    """Score matched deaths in their season; returns the updated picks"""
+    scored = {}
+    for entry, pick in sorted(matches, key=lambda m: m[0]['death_date']):
+        if pick['id'] in scored or pick['season_year'] != int(entry['death_date'][:4]):
+            continue  # a death only scores the season of the year it happened, once
+        if not pick['birth_date'] and entry['age'] is None:
+            print(f"  ? {pick['celebrity_name']}: no birth date or age, skipped")
+            continue
+        scored[pick['id']] = (entry, pick)
+    if not scored:
+        return []
+
+    # Without a birth date the database scores a death from the stored age, so take the feed's
+    cursor.executemany("UPDATE picks SET age = %s WHERE id = %s AND birth_date IS NULL AND death_date IS NULL",
+                       [(entry['age'], pick['id']) for entry, pick in scored.values() if not pick['birth_date']])
+    for season_year in sorted({pick['season_year'] for _, pick in scored.values()}):
+        deaths = [(pick['id'], entry['death_date']) for entry, pick in scored.values()
+                  if pick['season_year'] == season_year]
+        scoring.score_deaths(cursor, season_year, deaths, living_only=True)
+        season_cache.bump_version(cursor, season_year)
+    cursor.executemany("""
+        UPDATE celebrities SET death_date = %s WHERE page_id = %s AND death_date IS NULL
+    """, sorted({(entry['death_date'], pick['celebrity_id']) for entry, pick in scored.values() if pick['celebrity_id']}))
+
+    placeholders = ', '.join(['%s'] * len(scored))
+    cursor.execute(f"""
+        SELECT id, celebrity_name, season_year, death_date, death_age, points FROM picks
+        WHERE id IN ({placeholders}) ORDER BY death_date, id
+    """, tuple(scored))
+    updated = cursor.fetchall()
+    for season_year in sorted({pick['season_year'] for pick in updated}):
+        events.publish_pick_changes(cursor, season_year, [pick['id'] for pick in updated
+                                                          if pick['season_year'] == season_year])
+    return updated
+
+
+def ingest(source):
+    entries = fetch_year(int(source)) if source.isdigit() else read_file(source)
+    print(f"Read {len(entries)} deaths from {source}")
+    with get_db_connection(write=True) as conn:
+        cursor = conn.cursor(dictionary=True)
+        scored = apply(cursor, match(conn, entries))
+        conn.commit()
+    for pick in scored:
+        print(f"  💀 {pick['celebrity_name']} (season {pick['season_year']}): Died {pick['death_date']}, "
+              f"Age {pick['death_age']}, {pick['points']} points")
+    print(f"Scored {len(scored)} picks")
+    return scored
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    ingest(sys.argv[1])
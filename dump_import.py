@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Build the local birth/death index (wiki_index.py) from a Wikipedia dump.
+
+Usage: python3 dump_import.py <pages-articles.xml[.bz2]> [index_path] [workers]
+
+The dump is read as a stream, bz2-compressed or plain, and each <page> is
+discarded as soon as it has been handed off, so memory stays flat however
+big the dump is. Articles with an infobox are parsed for birth and death
+dates and a short description on a pool of ``workers`` processes (default:
+one per CPU), with a bounded number of batches in flight. Redirects are
+kept too, so "Michael J Fox" finds "Michael J. Fox".
+
+Try it on the fixture: python3 dump_import.py fixtures/dump/sample-pages-articles.xml /tmp/wiki_index.db
+"""
+import bz2
+import os
+import re
+import sqlite3
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import infobox
+import names
+import wiki_index
+
+PAGES_PER_TASK = 500
+PROGRESS_EVERY = 100000  # pages
+
+_SHORT_DESCRIPTION = re.compile(r'\{\{\s*short description\s*\|([^{}|]*)', re.IGNORECASE)
+
+
+def open_dump(path):
+    """The dump as a binary stream, decompressing bz2 whatever the file is called"""
+    with open(path, 'rb') as f:
+        magic = f.read(3)
+    return bz2.open(path, 'rb') if magic == b'BZh' else open(path, 'rb')
+
+
+def read_pages(stream):
+    """Yield (title, page_id, rev_id, redirect target or None, wikitext) for main-namespace pages"""
+    context = ET.iterparse(stream, events=('start', 'end'))
+    _, root = next(context)
+    ns = root.tag[:root.tag.index('}') + 1] if root.tag.startswith('{') else ''
+    for event, elem in context:
+        if event != 'end' or elem.tag != ns + 'page':
+            continue
+        if elem.findtext(ns + 'ns') == '0':
+            redirect = elem.find(ns + 'redirect')
+            revision = elem.find(ns + 'revision')
+            rev_id = text = None
+            if revision is not None:
+                rev_id = int(revision.findtext(ns + 'id'))
+                text = revision.findtext(ns + 'text')
+            yield (elem.findtext(ns + 'title'), int(elem.findtext(ns + 'id')), rev_id,
+                   redirect.get('title') if redirect is not None else None, text or '')
+        # Drop the page, and the root's reference to it, so memory stays flat
+        elem.clear()
+        root.clear()
+
+
+def parse_pages(pages):
+    """Rows for the people table from (title, page_id, rev_id, wikitext); runs in a worker process"""
+    rows = []
+    for title, page_id, rev_id, text in pages:
+        birth_date, death_date = infobox.dates(text)
+        if not birth_date:
+            continue
+        match = _SHORT_DESCRIPTION.search(text, 0, 2000)
+        description = match.group(1).strip() if match else ''
+        rows.append((page_id, title, rev_id, birth_date, death_date, description, names.normalize(title)))
+    return rows
+
+
+def import_dump(path, index_path=wiki_index.INDEX_PATH, workers=None):
+    conn = sqlite3.connect(index_path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = OFF")  # the index can always be rebuilt from the dump
+    conn.executescript(wiki_index.SCHEMA)
+
+    workers = workers or os.cpu_count() or 1
+    seen = parsed = people = redirects = 0
+    started = time.monotonic()
+
+    def store(rows):
+        conn.executemany("INSERT OR REPLACE INTO people (page_id, title, rev_id, birth_date, death_date, "
+                         "description, name_key) VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.commit()
+        return len(rows)
+
+    with open_dump(path) as stream, ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        batch = []
+        redirect_rows = []
+        for title, page_id, rev_id, target, text in read_pages(stream):
+            seen += 1
+            if target:
+                redirect_rows.append((title, target))
+            elif infobox.has_infobox(text):
+                batch.append((title, page_id, rev_id, text))
+
+            if len(batch) >= PAGES_PER_TASK:
+                parsed += len(batch)
+                in_flight.append(pool.submit(parse_pages, batch))
+                batch = []
+                # Waiting on the oldest batch keeps at most 2 per worker in memory
+                while len(in_flight) >= workers * 2:
+                    people += store(in_flight.popleft().result())
+            if len(redirect_rows) >= PAGES_PER_TASK:
+                conn.executemany("INSERT OR REPLACE INTO redirects (title, target) VALUES (?, ?)", redirect_rows)
+                redirects += len(redirect_rows)
+                redirect_rows = []
+            if seen % PROGRESS_EVERY == 0:
+                print(f"{seen} pages, {people} people, {seen / (time.monotonic() - started):.0f} pages/sec")
+
+        if batch:
+            parsed += len(batch)
+            in_flight.append(pool.submit(parse_pages, batch))
+        while in_flight:
+            people += store(in_flight.popleft().result())
+        conn.executemany("INSERT OR REPLACE INTO redirects (title, target) VALUES (?, ?)", redirect_rows)
+        redirects += len(redirect_rows)
+
+    conn.executescript(wiki_index.INDEXES)
+    conn.commit()
+    conn.close()
+
+    elapsed = time.monotonic() - started
+    print(f"Imported {people} people and {redirects} redirects from {seen} main-namespace pages "
+          f"({parsed} with an infobox) in {elapsed:.1f}s, {seen / elapsed:.0f} pages/sec with {workers} workers")
+    return seen, people, redirects
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    import_dump(sys.argv[1],
+                sys.argv[2] if len(sys.argv) > 2 else wiki_index.INDEX_PATH,
+                int(sys.argv[3]) if len(sys.argv) > 3 else None)
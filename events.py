@@ -0,0 +1,162 @@
+"""Live leaderboard updates pushed to browsers over Server-Sent Events.
+
+Write routes call ``publish_pick_changes`` inside their transaction, which
+stores a small JSON delta per season in ``pick_events``. Each web process
+runs one poller thread that picks up new rows and fans them out to the SSE
+streams connected to that process, so an event reaches every browser no
+matter which worker handled the write, and idle streams never hold a
+database connection.
+
+Each open stream is a long-lived response. Run the app under a gevent
+worker (``gunicorn -k gevent``) so an idle stream is a cheap greenlet
+rather than a blocked WSGI thread.
+"""
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+import season_summary
+from db import get_db_connection
+
+POLL_INTERVAL = float(os.environ.get('EVENTS_POLL_INTERVAL', 1))   # seconds between pick_events polls
+HEARTBEAT = float(os.environ.get('EVENTS_HEARTBEAT', 15))          # keep-alive comment for idle streams
+KEEP_EVENTS = 1000                                                  # rows kept for Last-Event-ID replay
+
+
+def publish_pick_changes(cursor, season_year, pick_ids, removed=()):
+    """Record what a browser needs to patch after these picks' death/points changed.
+
+    Call once per season, after all of a transaction's updates: the season
+    summary is built once and the picks go out together in one delta.
+    ``removed`` lists deleted picks as {'id', 'participant_id'}.
+    """
+    summary = season_summary.load(cursor, season_year)
+    wanted = set(pick_ids)
+    picks = [row for card in summary['participants'] for row in card['picks'] if row['id'] in wanted]
+    if not picks and not removed:
+        return
+
+    cursor.execute("SELECT picks_locked FROM season_config WHERE season_year = %s", (season_year,))
+    season = cursor.fetchone()
+
+    payload = {
+        'picks_locked': bool(season and season['picks_locked']),
+        'picks': [
+            {'id': pick['id'], 'participant_id': pick['participant_id'], 'age': pick['age'],
+             'birth_date': _date(pick['birth_date']), 'death_date': _date(pick['death_date']),
+             'death_age': pick['death_age'], 'points': pick['points']}
+            for pick in picks
+        ],
+        'removed': [{'id': pick['id'], 'participant_id': pick['participant_id']} for pick in removed],
+        'leaderboard': [
+            {'id': c['id'], 'name': c['name'], 'total_points': c['total_points'], 'deaths_count': c['deaths_count']}
+            for c in summary['leaderboard']
+        ],
+        'first_blood': [
+            {'id': pk['id'], 'participant_name': pk['participant_name'], 'celebrity_name': pk['celebrity_name'],
+             'death_date': _date(pk['death_date']), 'death_age': pk['death_age']}
+            for pk in summary['first_blood_picks']
+        ],
+        'first_blood_names': summary['first_blood_names'],
+    }
+    cursor.execute("""
+        INSERT INTO pick_events (season_year, payload)
+        VALUES (%s, %s)
+    """, (season_year, json.dumps(payload)))
+    cursor.execute("DELETE FROM pick_events WHERE id <= %s", (cursor.lastrowid - KEEP_EVENTS,))
+
+
+def _date(value):
+    return str(value) if value is not None else None
+
+
+def for_viewer(payload, viewer_id):
+    """Hide other participants' pick details while a season is in draft mode"""
+    if payload['picks_locked']:
+        return payload
+    return dict(payload, picks=[pick for pick in payload['picks'] if pick['participant_id'] == viewer_id],
+                removed=[pick for pick in payload['removed'] if pick['participant_id'] == viewer_id])
+
+
+class Broker:
+    """Fans pick_events rows out to the SSE streams connected to this process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}  # season_year -> set of queues
+        self._thread = None
+        self._last_id = None
+
+    @contextmanager
+    def subscribe(self, season_year):
+        q = queue.Queue(maxsize=100)
+        with self._lock:
+            self._subscribers.setdefault(season_year, set()).add(q)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._poll, name='pick-events', daemon=True)
+                self._thread.start()
+        try:
+            yield q
+        finally:
+            with self._lock:
+                self._subscribers[season_year].discard(q)
+
+    def subscriber_count(self):
+        with self._lock:
+            return sum(len(qs) for qs in self._subscribers.values())
+
+    def _poll(self):
+        while True:
+            time.sleep(POLL_INTERVAL)
+            if not self.subscriber_count():
+                # Nobody missed anything; the next subscriber starts from the newest event
+                self._last_id = None
+                continue
+            try:
+                if self._last_id is None:
+                    # Streams replay anything older themselves via Last-Event-ID
+                    self._last_id = latest_event_id()
+                self._dispatch(fetch_since(self._last_id))
+            except Exception as e:
+                print(f"Error polling pick events: {type(e).__name__}: {e}")
+
+    def _dispatch(self, rows):
+        for row in rows:
+            self._last_id = row['id']
+            with self._lock:
+                targets = list(self._subscribers.get(row['season_year'], ()))
+            for q in targets:
+                try:
+                    q.put_nowait(row)
+                except queue.Full:
+                    pass  # a stalled client misses deltas; it resyncs on reconnect
+
+
+def latest_event_id():
+    with get_db_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT COALESCE(MAX(id), 0) AS id FROM pick_events")
+        return cursor.fetchone()['id']
+
+
+def fetch_since(last_id, season_year=None):
+    """pick_events rows after last_id, optionally for one season"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        if season_year is None:
+            cursor.execute("""
+                SELECT id, season_year, payload FROM pick_events
+                WHERE id > %s ORDER BY id
+            """, (last_id,))
+        else:
+            cursor.execute("""
+                SELECT id, season_year, payload FROM pick_events
+                WHERE id > %s AND season_year = %s ORDER BY id
+            """, (last_id, season_year))
+        return cursor.fetchall()
+
+
+broker = Broker()
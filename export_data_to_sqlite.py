@@ -1,22 +1,22 @@
 #!/usr/bin/env python3
 """Export data from local MySQL database to SQLite format"""
-import mysql.connector
-
-DB_CONFIG = {
-    'host': 'localhost',
-    'user': 'root',
-    'password': '14231423',
-    'database': 'deathpool'
-}
+import db
 
 def export_to_sql():
-    conn = mysql.connector.connect(**DB_CONFIG)
+    conn = db.connect('mysql')
     cursor = conn.cursor(dictionary=True)
 
     # Get all participants
     cursor.execute("SELECT * FROM participants ORDER BY id")
     participants = cursor.fetchall()
 
+    # Get all celebrities
+    cursor.execute("SELECT * FROM celebrities ORDER BY page_id")
+    celebrities = cursor.fetchall()
+
+    cursor.execute("SELECT * FROM celebrity_names ORDER BY name_key")
+    celebrity_names = cursor.fetchall()
+
     # Get all picks
     cursor.execute("SELECT * FROM picks ORDER BY id")
     picks = cursor.fetchall()
@@ -37,6 +37,19 @@ def export_to_sql():
         for p in participants:
             f.write(f"INSERT INTO participants (id, name) VALUES ({p['id']}, '{p['name']}');\n")
 
+        f.write("\n-- Celebrities\n")
+        for c in celebrities:
+            values = [str(c['page_id'])]
+            for key in ('title', 'birth_date', 'death_date', 'wikipedia_url', 'description'):
+                # Escape single quotes
+                values.append("'" + str(c[key]).replace("'", "''") + "'" if c[key] is not None else 'NULL')
+            values.append(str(c['rev_id']) if c.get('rev_id') else 'NULL')
+            f.write(f"INSERT OR REPLACE INTO celebrities (page_id, title, birth_date, death_date, wikipedia_url, description, rev_id) VALUES ({', '.join(values)});\n")
+
+        for n in celebrity_names:
+            name_key = n['name_key'].replace("'", "''")
+            f.write(f"INSERT OR REPLACE INTO celebrity_names (name_key, page_id) VALUES ('{name_key}', {n['page_id']});\n")
+
         f.write("\n-- Picks\n")
         for pick in picks:
             # Build the INSERT statement with only non-null values
@@ -64,14 +77,6 @@ def export_to_sql():
                 columns.append('death_date')
                 values.append(f"'{pick['death_date']}'")
 
-            if pick['death_age'] is not None:
-                columns.append('death_age')
-                values.append(str(pick['death_age']))
-
-            if pick['points'] is not None and pick['points'] > 0:
-                columns.append('points')
-                values.append(str(pick['points']))
-
             if pick['is_first_blood']:
                 columns.append('is_first_blood')
                 values.append('1')
@@ -86,9 +91,17 @@ def export_to_sql():
                 desc = pick['description'].replace("'", "''") if pick['description'] else ''
                 values.append(f"'{desc}'")
 
+            if pick.get('celebrity_id'):
+                columns.append('celebrity_id')
+                values.append(str(pick['celebrity_id']))
+
+            if pick.get('name_key'):
+                columns.append('name_key')
+                values.append("'" + pick['name_key'].replace("'", "''") + "'")
+
             f.write(f"INSERT INTO picks ({', '.join(columns)}) VALUES ({', '.join(values)});\n")
 
-    print(f"✓ Exported {len(participants)} participants and {len(picks)} picks to data_export.sql")
+    print(f"✓ Exported {len(participants)} participants, {len(celebrities)} celebrities and {len(picks)} picks to data_export.sql")
     print(f"\nNow:")
     print(f"1. git add data_export.sql && git commit -m 'Add data export' && git push")
     print(f"2. On PythonAnywhere: cd ~/endgame && git pull")
@@ -54,7 +54,7 @@ def main():
 
     print("-- picks")
     pk_cols = ['id', 'participant_id', 'celebrity_name', 'birth_date', 'age',
-               'death_date', 'death_age', 'points', 'is_first_blood', 'season_year',
+               'death_date', 'is_first_blood', 'season_year',
                'wikipedia_url', 'description', 'created_at', 'updated_at']
     for row in data['picks']:
         print(insert_row('picks', pk_cols, row))
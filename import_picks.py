@@ -1,11 +1,4 @@
-import mysql.connector
-
-DB_CONFIG = {
-    'host': 'localhost',
-    'user': 'root',
-    'password': '14231423',
-    'database': 'deathpool'
-}
+import db
 
 # Participants
 participants = ['Jim', 'Drew', 'Oost']
@@ -171,7 +164,7 @@ picks_data = {
 }
 
 def import_data():
-    conn = mysql.connector.connect(**DB_CONFIG)
+    conn = db.connect()
     cursor = conn.cursor()
 
     # Clear existing data
@@ -179,8 +172,7 @@ def import_data():
     cursor.execute("DELETE FROM participants")
 
     # Insert participants
-    for participant in participants:
-        cursor.execute("INSERT INTO participants (name) VALUES (%s)", (participant,))
+    cursor.executemany("INSERT INTO participants (name) VALUES (%s)", [(participant,) for participant in participants])
 
     conn.commit()
 
@@ -191,13 +183,11 @@ def import_data():
         participant_ids[row[1]] = row[0]
 
     # Insert picks
-    for participant, celebrities in picks_data.items():
-        participant_id = participant_ids[participant]
-        for celebrity in celebrities:
-            cursor.execute("""
-                INSERT INTO picks (participant_id, celebrity_name, season_year)
-                VALUES (%s, %s, 2025)
-            """, (participant_id, celebrity))
+    cursor.executemany("""
+        INSERT INTO picks (participant_id, celebrity_name, season_year)
+        VALUES (%s, %s, 2025)
+    """, [(participant_ids[participant], celebrity)
+          for participant, celebrities in picks_data.items() for celebrity in celebrities])
 
     conn.commit()
     cursor.close()
@@ -0,0 +1,140 @@
+"""Birth and death dates from a Wikipedia article's infobox.
+
+The infobox is located once and its parameters are split in a single pass
+over the wikitext, tracking template and link nesting so a ``|`` inside
+``{{birth date|...}}`` or ``[[link|text]]`` isn't taken for a parameter
+break. Only the birth_date and death_date values are then parsed, so the
+rest of a long biography is never scanned.
+"""
+import re
+from datetime import date
+
+_INFOBOX = re.compile(r'\{\{\s*infobox', re.IGNORECASE)
+_TOKEN = re.compile(r'<!--.*?-->|\{\{|\}\}|\[\[|\]\]|\|', re.DOTALL)
+_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+_REF = re.compile(r'<ref[^>]*/>|<ref[^>]*>.*?</ref>', re.DOTALL | re.IGNORECASE)
+_INNER_TEMPLATE = re.compile(r'\{\{\s*([^{}|]+?)\s*\|([^{}]*)\}\}')
+_NUMBER = re.compile(r'\d{1,4}$')
+
+MONTHS = {name: i for i, name in enumerate(
+    ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+     'august', 'september', 'october', 'november', 'december'], 1)}
+MONTHS.update({name[:3]: i for name, i in list(MONTHS.items())})
+MONTHS['sept'] = 9
+_MONTH = '(' + '|'.join(sorted(MONTHS, key=len, reverse=True)) + r')\.?'
+_TEXT_DATES = [
+    (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'), ('y', 'm', 'd')),
+    (re.compile(r'(\d{1,2})\s+' + _MONTH + r',?\s+(\d{4})', re.IGNORECASE), ('d', 'M', 'y')),
+    (re.compile(_MONTH + r'\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE), ('M', 'd', 'y')),
+]
+
+# Template names, lowercased with '-' and '_' read as spaces. Each takes the
+# date as year|month|day or, for the hyphenated text forms, as free text.
+# "death date and age" and "dda" carry the birth date in arguments 4-6.
+BIRTH_TEMPLATES = {
+    'birth date and age', 'birth date', 'bda', 'dob', 'birth date and age2',
+    'b da', 'birthdate and age', 'birthdate',
+}
+DEATH_TEMPLATES = {
+    'death date and age', 'death date', 'dda', 'death date and given age',
+    'd da', 'deathdate and age', 'deathdate',
+}
+
+DATE_FIELDS = {'birth_date', 'death_date'}
+
+
+def has_infobox(text):
+    """Whether some wikitext contains an infobox, e.g. a lead section worth parsing"""
+    return bool(_INFOBOX.search(text))
+
+
+def parameters(text, wanted=None):
+    """Named parameters of the first infobox in some wikitext, as {name: value}
+
+    With ``wanted``, a set of parameter names, scanning stops as soon as all
+    of them have been seen.
+    """
+    match = _INFOBOX.search(text)
+    if not match:
+        return {}
+
+    params = {}
+    depth = 0
+    field_start = None
+    for token in _TOKEN.finditer(text, match.start()):
+        kind = token.group()
+        if kind == '|':
+            if depth == 1:
+                _add_field(params, text, field_start, token.start())
+                if wanted and wanted.issubset(params):
+                    break
+                field_start = token.end()
+        elif kind == '{{' or kind == '[[':
+            depth += 1
+        elif kind == '}}' or kind == ']]':
+            depth -= 1
+            if depth == 0:
+                _add_field(params, text, field_start, token.start())
+                break
+        # comments are matched whole so a | inside one is skipped
+    return params
+
+
+def _add_field(params, text, start, end):
+    if start is None:
+        return  # the template name itself
+    name, sep, value = text[start:end].partition('=')
+    if sep:
+        params[name.strip().lower().replace(' ', '_')] = _COMMENT.sub('', value).strip()
+
+
+def _template_dates(value, templates):
+    """(date, date from args 4-6) from the first matching template in a value"""
+    # Innermost templates first, so {{circa|{{death date|...}}}} finds the date inside
+    for match in _INNER_TEMPLATE.finditer(value):
+        name = match.group(1).lower().replace('-', ' ').replace('_', ' ')
+        if name not in templates:
+            continue
+        args = [arg.strip() for arg in match.group(2).split('|') if '=' not in arg]
+        if len(args) >= 3 and all(_NUMBER.match(arg) for arg in args[:3]):
+            numbers = [int(arg) for arg in args[:6] if _NUMBER.match(arg)]
+            return _date(*numbers[:3]), _date(*numbers[3:6]) if len(numbers) >= 6 else None
+        if args:
+            return _text_date(args[0]), None
+    return None, None
+
+
+def _text_date(value):
+    value = _REF.sub('', value)  # "Retrieved 5 March 2024" is not a birthday
+    for pattern, order in _TEXT_DATES:
+        match = pattern.search(value)
+        if match:
+            parts = dict(zip(order, match.groups()))
+            month = int(parts['m']) if 'm' in parts else MONTHS[parts['M'].lower().rstrip('.')]
+            return _date(int(parts['y']), month, int(parts['d']))
+    return None
+
+
+def _date(year, month, day):
+    try:
+        return date(year, month, day).isoformat()
+    except (TypeError, ValueError):
+        return None
+
+
+def dates(text):
+    """(birth_date, death_date) as YYYY-MM-DD strings, or (None, None) without a birth date"""
+    params = parameters(text, DATE_FIELDS)
+    birth_value = params.get('birth_date', '')
+    death_value = params.get('death_date', '')
+
+    birth_date, _ = _template_dates(birth_value, BIRTH_TEMPLATES)
+    death_date, born = _template_dates(death_value, DEATH_TEMPLATES)
+    if not birth_date:
+        birth_date = born or _text_date(birth_value)
+    if not death_date and death_value:
+        death_date = _text_date(death_value)
+
+    if not birth_date:
+        return None, None
+    return birth_date, death_date
@@ -0,0 +1,214 @@
+"""Background Wikipedia age lookups.
+
+``/lookup_age`` queues a row in ``lookup_jobs`` and returns straight away;
+worker threads in each web process claim queued jobs, call Wikipedia
+without holding a database connection, and write the result back. Jobs
+live in the database, so they survive restarts and any process can report
+on them via ``/jobs/<id>``.
+"""
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+import celebrities
+import events
+import season_cache
+from db import get_db_connection
+
+WORKERS = int(os.environ.get('LOOKUP_WORKERS', 2))
+MAX_ATTEMPTS = int(os.environ.get('LOOKUP_MAX_ATTEMPTS', 4))
+RETRY_BASE = float(os.environ.get('LOOKUP_RETRY_BASE', 5))   # seconds; doubles per attempt
+LEASE = timedelta(seconds=int(os.environ.get('LOOKUP_LEASE', 120)))  # a running job whose lease lapses is retried
+IDLE_POLL = 2  # seconds between queue checks when nothing was submitted locally
+
+IN_FLIGHT = ('queued', 'running')
+FAILED = {'success': False, 'error': 'Wikipedia is unavailable, try again later'}  # result of a job out of attempts
+
+
+def submit(cursor, pick_id, celebrity_name):
+    """Queue a lookup for a pick, reusing one that is already in flight. Returns the job id.
+
+    Locking the pick row first queues concurrent submits for the same pick
+    behind one another, so the second sees the first's job instead of adding
+    its own. Call inside a write transaction (``get_db_connection(write=True)``).
+    """
+    cursor.execute("SELECT id FROM picks WHERE id = %s FOR UPDATE", (pick_id,))
+    cursor.fetchall()
+    # A locking read, so it sees a job committed while we waited for the pick
+    cursor.execute("""
+        SELECT id FROM lookup_jobs
+        WHERE pick_id = %s AND status IN (%s, %s)
+        ORDER BY id LIMIT 1
+        FOR UPDATE
+    """, (pick_id,) + IN_FLIGHT)
+    existing = cursor.fetchone()
+    if existing:
+        return existing['id']
+
+    cursor.execute("""
+        INSERT INTO lookup_jobs (pick_id, celebrity_name, status, run_after)
+        VALUES (%s, %s, 'queued', %s)
+    """, (pick_id, celebrity_name, datetime.now()))
+    return cursor.lastrowid
+
+
+def get_job(cursor, job_id):
+    cursor.execute("""
+        SELECT j.id, j.pick_id, j.status, j.attempts, j.result, j.error, p.participant_id
+        FROM lookup_jobs j
+        JOIN picks p ON p.id = j.pick_id
+        WHERE j.id = %s
+    """, (job_id,))
+    job = cursor.fetchone()
+    if job and job['result']:
+        job['result'] = json.loads(job['result'])
+    return job
+
+
+def apply_result(cursor, pick_id, result):
+    """Write a Wikipedia lookup result onto a pick and every other pick of the same person"""
+    cursor.execute("SELECT celebrity_name FROM picks WHERE id = %s", (pick_id,))
+    pick = cursor.fetchone()
+    if not pick:
+        return
+
+    picks = celebrities.apply(cursor, pick_id, result, pick['celebrity_name'])
+
+    for season_year in sorted({pick['season_year'] for pick in picks}):
+        season_cache.bump_version(cursor, season_year)
+        events.publish_pick_changes(cursor, season_year, [pick['id'] for pick in picks
+                                                          if pick['season_year'] == season_year])
+
+
+class LookupWorkers:
+    """Threads that drain lookup_jobs using ``fetch(celebrity_name)``.
+
+    ``fetch`` returns a result dict, None if Wikipedia has no usable page,
+    or raises for transient failures, which are retried with exponential
+    backoff up to MAX_ATTEMPTS.
+    """
+
+    def __init__(self, fetch, workers=WORKERS):
+        self.fetch = fetch
+        self.workers = workers
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def start(self):
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f'lookup-worker-{i}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def notify(self):
+        """Start the workers if needed and wake one up for a new job"""
+        self.start()
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            try:
+                job = self._claim()
+            except Exception as e:
+                print(f"Error claiming lookup job: {type(e).__name__}: {e}")
+                job = None
+            if job is None:
+                self._wake.wait(IDLE_POLL)
+                self._wake.clear()
+                continue
+            try:
+                self._execute(job)
+            except Exception as e:
+                # The job's lease runs out and another worker retries it
+                print(f"Error running lookup job {job['id']}: {type(e).__name__}: {e}")
+
+    def _claim(self):
+        now = datetime.now()
+        with get_db_connection(write=True) as conn:
+            cursor = conn.cursor(dictionary=True)
+            # A job whose worker crashed or hung on every attempt is given up on, not reclaimed forever
+            cursor.execute("""
+                UPDATE lookup_jobs
+                SET status = 'failed', error = 'Lease lapsed on the last attempt', locked_until = NULL, result = %s
+                WHERE status = 'running' AND locked_until < %s AND attempts >= %s
+            """, (json.dumps(FAILED), now, MAX_ATTEMPTS))
+            cursor.execute("""
+                SELECT id, pick_id, celebrity_name, attempts FROM lookup_jobs
+                WHERE (status = 'queued' AND run_after <= %s)
+                   OR (status = 'running' AND locked_until < %s AND attempts < %s)
+                ORDER BY run_after, id
+                LIMIT 1
+            """, (now, now, MAX_ATTEMPTS))
+            job = cursor.fetchone()
+            if not job:
+                conn.commit()
+                return None
+            # Conditional update so only one worker, in any process, wins the job
+            cursor.execute("""
+                UPDATE lookup_jobs
+                SET status = 'running', attempts = attempts + 1, locked_until = %s
+                WHERE id = %s AND attempts = %s
+            """, (now + LEASE, job['id'], job['attempts']))
+            claimed = cursor.rowcount == 1
+            conn.commit()
+        if not claimed:
+            return None
+        job['attempts'] += 1
+        return job
+
+    def _execute(self, job):
+        # A failure writing the result is retried like a failed fetch, not left running
+        try:
+            result = self.fetch(job['celebrity_name'])
+            self._record(job, result)
+        except Exception as e:
+            self._retry_or_fail(job, f"{type(e).__name__}: {e}")
+
+    def _record(self, job, result):
+        with get_db_connection(write=True) as conn:
+            cursor = conn.cursor(dictionary=True)
+            if result and result['age'] is not None:
+                apply_result(cursor, job['pick_id'], result)
+                response = {
+                    'success': True,
+                    'age': result['age'],
+                    'birth_date': result['birth_date'],
+                    'death_date': result['death_date'],
+                    'deceased': result['death_date'] is not None
+                }
+            else:
+                response = {
+                    'success': False,
+                    'error': 'Could not find age information'
+                }
+            cursor.execute("""
+                UPDATE lookup_jobs
+                SET status = 'done', result = %s, error = NULL, locked_until = NULL
+                WHERE id = %s
+            """, (json.dumps(response), job['id']))
+            conn.commit()
+
+    def _retry_or_fail(self, job, error):
+        print(f"Lookup for {job['celebrity_name']} failed (attempt {job['attempts']}): {error}")
+        with get_db_connection(write=True) as conn:
+            cursor = conn.cursor(dictionary=True)
+            if job['attempts'] < MAX_ATTEMPTS:
+                delay = RETRY_BASE * 2 ** (job['attempts'] - 1)
+                cursor.execute("""
+                    UPDATE lookup_jobs
+                    SET status = 'queued', error = %s, run_after = %s, locked_until = NULL
+                    WHERE id = %s
+                """, (error, datetime.now() + timedelta(seconds=delay), job['id']))
+            else:
+                cursor.execute("""
+                    UPDATE lookup_jobs
+                    SET status = 'failed', error = %s, locked_until = NULL,
+                        result = %s
+                    WHERE id = %s
+                """, (error, json.dumps(FAILED), job['id']))
+            conn.commit()
@@ -0,0 +1,2 @@
+-- Per-season data version, bumped by every write route to invalidate cached dashboard results
+ALTER TABLE season_config ADD COLUMN data_version INTEGER NOT NULL DEFAULT 0;
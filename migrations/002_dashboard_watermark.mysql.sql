@@ -0,0 +1,3 @@
+-- Watermark for conditional GETs on the dashboard
+ALTER TABLE season_config ADD COLUMN updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP;
+CREATE INDEX idx_season_updated ON picks(season_year, updated_at);
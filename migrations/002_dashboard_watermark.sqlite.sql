@@ -0,0 +1,12 @@
+-- Watermark for conditional GETs on the dashboard
+-- (SQLite can't add a column with a non-constant default; bump_version fills it in)
+ALTER TABLE season_config ADD COLUMN updated_at DATETIME DEFAULT NULL;
+CREATE INDEX IF NOT EXISTS idx_season_updated ON picks(season_year, updated_at);
+
+-- SQLite has no ON UPDATE CURRENT_TIMESTAMP, so keep updated_at current with a trigger
+CREATE TRIGGER IF NOT EXISTS picks_touch_updated_at
+AFTER UPDATE ON picks
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE picks SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
@@ -0,0 +1,7 @@
+-- Deltas pushed to open dashboards over Server-Sent Events
+CREATE TABLE IF NOT EXISTS pick_events (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    season_year INT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
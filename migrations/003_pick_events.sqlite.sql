@@ -0,0 +1,7 @@
+-- Deltas pushed to open dashboards over Server-Sent Events
+CREATE TABLE IF NOT EXISTS pick_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    season_year INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
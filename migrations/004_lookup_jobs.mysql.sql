@@ -0,0 +1,18 @@
+-- Background Wikipedia lookups queued by /lookup_age
+CREATE TABLE IF NOT EXISTS lookup_jobs (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    pick_id INT NOT NULL,
+    celebrity_name VARCHAR(255) NOT NULL,
+    status VARCHAR(16) NOT NULL DEFAULT 'queued',
+    attempts INT NOT NULL DEFAULT 0,
+    run_after DATETIME NOT NULL,
+    locked_until DATETIME DEFAULT NULL,
+    result TEXT DEFAULT NULL,
+    error TEXT DEFAULT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (pick_id) REFERENCES picks(id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_lookup_jobs_status ON lookup_jobs(status, run_after);
+CREATE INDEX idx_lookup_jobs_pick ON lookup_jobs(pick_id, status);
@@ -0,0 +1,17 @@
+-- One row per real person, keyed by Wikipedia page id and shared by every pick of them
+CREATE TABLE IF NOT EXISTS celebrities (
+    page_id INT PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    birth_date DATE DEFAULT NULL,
+    death_date DATE DEFAULT NULL,
+    wikipedia_url TEXT DEFAULT NULL,
+    description TEXT DEFAULT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+ALTER TABLE picks
+    ADD COLUMN celebrity_id INT DEFAULT NULL AFTER description,
+    ADD FOREIGN KEY (celebrity_id) REFERENCES celebrities(page_id) ON DELETE SET NULL;
+
+CREATE INDEX idx_picks_celebrity ON picks(celebrity_id);
@@ -0,0 +1,15 @@
+-- One row per real person, keyed by Wikipedia page id and shared by every pick of them
+CREATE TABLE IF NOT EXISTS celebrities (
+    page_id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    birth_date DATE DEFAULT NULL,
+    death_date DATE DEFAULT NULL,
+    wikipedia_url TEXT DEFAULT NULL,
+    description TEXT DEFAULT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE picks ADD COLUMN celebrity_id INTEGER DEFAULT NULL REFERENCES celebrities(page_id) ON DELETE SET NULL;
+
+CREATE INDEX IF NOT EXISTS idx_picks_celebrity ON picks(celebrity_id);
@@ -0,0 +1,12 @@
+-- Normalized spellings of a name (see names.py) -> the celebrity they resolved to
+CREATE TABLE IF NOT EXISTS celebrity_names (
+    name_key VARCHAR(255) PRIMARY KEY,
+    page_id INT NOT NULL,
+    FOREIGN KEY (page_id) REFERENCES celebrities(page_id) ON DELETE CASCADE
+);
+
+ALTER TABLE picks ADD COLUMN name_key VARCHAR(255) DEFAULT NULL AFTER celebrity_id;
+
+CREATE INDEX idx_picks_name_key ON picks(name_key);
+
+-- Then fill in name_key on existing picks: python3 migrations/006_name_index.py
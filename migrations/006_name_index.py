@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Fill in name_key on existing picks, after 006_name_index.*.sql.
+
+Usage: python3 migrations/006_name_index.py
+
+names.normalize folds accents and honorifics, which the SQL migration
+can't do, so the keys are computed here. Every pick gets the key of its
+name; a participant's second pick of a name in a season keeps NULL, as
+idx_picks_participant_name (012) requires. Picks whose key is already right
+are left alone, so it is safe to run again, e.g. after names.py changes;
+spellings in celebrity_names that no longer normalize that way are dropped.
+Uses DB_BACKEND and DB_PATH like the other scripts.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import names  # noqa: E402
+from db import get_db_connection  # noqa: E402
+
+
+def refresh_name_keys(cursor):
+    """Set every pick's name_key from its name; returns how many changed"""
+    cursor.execute("SELECT id, participant_id, season_year, celebrity_name, name_key FROM picks ORDER BY id")
+    taken = set()
+    changes = []
+    for pick in cursor.fetchall():
+        key = names.normalize(pick['celebrity_name']) or None
+        if key is not None:
+            if (pick['participant_id'], pick['season_year'], key) in taken:
+                key = None
+            else:
+                taken.add((pick['participant_id'], pick['season_year'], key))
+        if key != pick['name_key']:
+            changes.append((key, pick['id']))
+
+    # Clear first, so no key is briefly held by two picks under the unique index
+    cursor.executemany("UPDATE picks SET name_key = NULL WHERE id = %s", [(pick_id,) for _, pick_id in changes])
+    cursor.executemany("UPDATE picks SET name_key = %s WHERE id = %s", [change for change in changes if change[0]])
+    return len(changes)
+
+
+def prune_celebrity_names(cursor):
+    """Forget spellings no title or linked pick normalizes to any more; returns how many"""
+    cursor.execute("SELECT page_id, title FROM celebrities")
+    current = {(names.normalize(row['title']), row['page_id']) for row in cursor.fetchall()}
+    cursor.execute("SELECT celebrity_id, celebrity_name FROM picks WHERE celebrity_id IS NOT NULL")
+    current |= {(names.normalize(row['celebrity_name']), row['celebrity_id']) for row in cursor.fetchall()}
+    cursor.execute("SELECT name_key, page_id FROM celebrity_names")
+    stale = [(row['name_key'],) for row in cursor.fetchall() if (row['name_key'], row['page_id']) not in current]
+    cursor.executemany("DELETE FROM celebrity_names WHERE name_key = %s", stale)
+    return len(stale)
+
+
+if __name__ == '__main__':
+    with get_db_connection(write=True) as conn:
+        cursor = conn.cursor(dictionary=True)
+        changed = refresh_name_keys(cursor)
+        pruned = prune_celebrity_names(cursor)
+        conn.commit()
+    print(f"Updated the name key of {changed} picks and forgot {pruned} stale spellings")
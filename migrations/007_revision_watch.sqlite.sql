@@ -0,0 +1,5 @@
+-- Page revision each celebrity's facts were read from, so death_watch.py
+-- only re-fetches articles that have been edited since
+ALTER TABLE celebrities ADD COLUMN rev_id INTEGER DEFAULT NULL;
+
+-- Existing celebrities are re-read once on the first death_watch run
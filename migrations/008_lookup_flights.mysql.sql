@@ -0,0 +1,8 @@
+-- One row per normalized name being looked up; the lease and shared result behind single_flight.py
+CREATE TABLE IF NOT EXISTS lookup_flights (
+    name_key VARCHAR(255) PRIMARY KEY,
+    owner VARCHAR(255) NOT NULL,
+    locked_until DATETIME DEFAULT NULL,
+    result TEXT DEFAULT NULL,
+    fetched_at DATETIME DEFAULT NULL
+);
@@ -0,0 +1,52 @@
+-- Per-season leaderboard row for each participant, kept in step with picks by the triggers below
+-- (python3 standings.py check|rebuild verifies or recomputes it)
+CREATE TABLE IF NOT EXISTS standings (
+    participant_id INT NOT NULL,
+    season_year INT NOT NULL,
+    pick_count INT NOT NULL DEFAULT 0,
+    total_points INT NOT NULL DEFAULT 0,
+    deaths_count INT NOT NULL DEFAULT 0,
+    first_blood TINYINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (participant_id, season_year),
+    FOREIGN KEY (participant_id) REFERENCES participants(id) ON DELETE CASCADE
+);
+
+-- The dashboard reads a season's leaderboard straight off this index, already in rank order
+CREATE INDEX idx_standings_rank ON standings(season_year, total_points DESC, deaths_count DESC);
+
+DELIMITER //
+CREATE TRIGGER standings_after_insert AFTER INSERT ON picks FOR EACH ROW
+BEGIN
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT NEW.participant_id, NEW.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = NEW.participant_id AND season_year = NEW.season_year;
+END//
+
+-- A pick can move between participants or seasons, so both rows are recomputed
+CREATE TRIGGER standings_after_update AFTER UPDATE ON picks FOR EACH ROW
+BEGIN
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT OLD.participant_id, OLD.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = OLD.participant_id AND season_year = OLD.season_year;
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT NEW.participant_id, NEW.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = NEW.participant_id AND season_year = NEW.season_year;
+END//
+
+CREATE TRIGGER standings_after_delete AFTER DELETE ON picks FOR EACH ROW
+BEGIN
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT OLD.participant_id, OLD.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = OLD.participant_id AND season_year = OLD.season_year;
+END//
+DELIMITER ;
+
+-- Fill it in for the picks already there
+INSERT INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+SELECT participant_id, season_year, COUNT(*), COALESCE(SUM(points), 0), COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+FROM picks
+GROUP BY participant_id, season_year;
@@ -0,0 +1,2 @@
+-- First Blood is the season's earliest death; scoring.py finds it with a seek on this index
+CREATE INDEX idx_picks_season_death ON picks(season_year, death_date);
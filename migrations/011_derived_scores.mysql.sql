@@ -0,0 +1,7 @@
+-- Derive death_age and points from the dates instead of storing what the app computed
+ALTER TABLE picks MODIFY COLUMN death_age INT GENERATED ALWAYS AS (CASE
+        WHEN death_date IS NULL THEN NULL
+        WHEN birth_date IS NULL THEN COALESCE(age, 0)
+        ELSE TIMESTAMPDIFF(YEAR, birth_date, death_date)
+    END) STORED;
+ALTER TABLE picks MODIFY COLUMN points INT GENERATED ALWAYS AS (CASE WHEN death_date IS NULL THEN 0 ELSE GREATEST(0, 100 - death_age) END) STORED;
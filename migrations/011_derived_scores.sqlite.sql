@@ -0,0 +1,50 @@
+-- Derive death_age and points from the dates instead of storing what the app computed.
+-- SQLite can only add generated columns as VIRTUAL, and can't drop a column a trigger
+-- uses, so the standings triggers are dropped and recreated around the swap.
+DROP TRIGGER IF EXISTS standings_after_insert;
+DROP TRIGGER IF EXISTS standings_after_update;
+DROP TRIGGER IF EXISTS standings_after_delete;
+
+ALTER TABLE picks DROP COLUMN points;
+ALTER TABLE picks DROP COLUMN death_age;
+ALTER TABLE picks ADD COLUMN death_age INTEGER GENERATED ALWAYS AS (CASE
+    WHEN death_date IS NULL THEN NULL
+    WHEN birth_date IS NULL THEN COALESCE(age, 0)
+    ELSE CAST(strftime('%Y', death_date) AS INTEGER) - CAST(strftime('%Y', birth_date) AS INTEGER)
+        - (strftime('%m-%d', death_date) < strftime('%m-%d', birth_date))
+END) VIRTUAL;
+ALTER TABLE picks ADD COLUMN points INTEGER GENERATED ALWAYS AS (CASE WHEN death_date IS NULL THEN 0 ELSE MAX(0, 100 - death_age) END) VIRTUAL;
+
+CREATE TRIGGER IF NOT EXISTS standings_after_insert
+AFTER INSERT ON picks
+BEGIN
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT NEW.participant_id, NEW.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = NEW.participant_id AND season_year = NEW.season_year;
+END;
+
+-- A pick can move between participants or seasons, so both rows are recomputed
+CREATE TRIGGER IF NOT EXISTS standings_after_update
+AFTER UPDATE OF participant_id, season_year, birth_date, age, death_date, is_first_blood ON picks
+BEGIN
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT OLD.participant_id, OLD.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = OLD.participant_id AND season_year = OLD.season_year;
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT NEW.participant_id, NEW.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = NEW.participant_id AND season_year = NEW.season_year;
+END;
+
+-- Picks deleted along with their participant take the participant's standings with them
+CREATE TRIGGER IF NOT EXISTS standings_after_delete
+AFTER DELETE ON picks
+WHEN EXISTS (SELECT 1 FROM participants WHERE id = OLD.participant_id)
+BEGIN
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT OLD.participant_id, OLD.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = OLD.participant_id AND season_year = OLD.season_year;
+END;
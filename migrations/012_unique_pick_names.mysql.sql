@@ -0,0 +1,10 @@
+-- A participant can pick a name once per season, under any spelling (name_key, see names.py).
+-- Earlier duplicates can already be in the table, so every pick but the first of a name
+-- loses its key; picks with no name_key don't conflict, and rollover.fill_name_keys
+-- (used by rollover.py and batch_lookup_ages.py) fills keys in without colliding.
+UPDATE picks p
+JOIN picks q ON q.participant_id = p.participant_id AND q.season_year = p.season_year
+            AND q.name_key = p.name_key AND q.id < p.id
+SET p.name_key = NULL;
+
+CREATE UNIQUE INDEX idx_picks_participant_name ON picks(participant_id, season_year, name_key);
@@ -0,0 +1,12 @@
+-- A participant can pick a name once per season, under any spelling (name_key, see names.py).
+-- Earlier duplicates can already be in the table, so every pick but the first of a name
+-- loses its key; picks with no name_key don't conflict, and rollover.fill_name_keys
+-- (used by rollover.py and batch_lookup_ages.py) fills keys in without colliding.
+UPDATE picks SET name_key = NULL
+WHERE name_key IS NOT NULL AND EXISTS (
+    SELECT 1 FROM picks q
+    WHERE q.participant_id = picks.participant_id AND q.season_year = picks.season_year
+      AND q.name_key = picks.name_key AND q.id < picks.id
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_picks_participant_name ON picks(participant_id, season_year, name_key);
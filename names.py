@@ -0,0 +1,32 @@
+"""Normalized celebrity names.
+
+Participants type the same person several ways ("Michael J. Fox",
+"Michael J Fox", "King Charles III"). ``normalize`` folds case, accents,
+punctuation and leading honorifics into one key, which is stored on picks
+(``picks.name_key``) and in ``celebrity_names`` so a name resolves to a
+Wikipedia page once, not once per spelling.
+"""
+import re
+import unicodedata
+
+# Dropped from the front of a name, as long as a first and last name are left:
+# "Sir Elton John" is "Elton John", but "Pope Francis" and "Lady Gaga" keep theirs
+HONORIFICS = {
+    'king', 'queen', 'pope', 'prince', 'princess', 'emperor', 'empress',
+    'sir', 'dame', 'lord', 'lady', 'saint', 'st',
+    'dr', 'president', 'senator', 'rev', 'reverend',
+    'mr', 'mrs', 'ms',
+}
+
+_DROP = re.compile(r"['’.]")  # O'Neal -> oneal, J. -> j
+_SPLIT = re.compile(r"[^\w]+")  # hyphens, commas, quotes -> word breaks
+
+
+def normalize(name):
+    """Lookup key for a celebrity name, e.g. 'Sir Elton John' -> 'elton john'"""
+    text = unicodedata.normalize('NFKD', name or '')
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    words = _SPLIT.sub(' ', _DROP.sub('', text)).split()
+    while len(words) > 2 and words[0] in HONORIFICS:
+        words.pop(0)
+    return ' '.join(words)
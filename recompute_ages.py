@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Bring every living pick's age up to date from its birth date.
+
+Usage: python3 recompute_ages.py [chunk_size]
+
+Ages are stored when a pick is looked up and go stale as birthdays pass,
+so run this nightly from cron. Each chunk of pick ids is one UPDATE that
+computes the age in SQL and only rewrites picks whose age changed, in its
+own short transaction, so a big table never holds the write lock for long.
+Seasons whose picks changed have their dashboard caches invalidated.
+"""
+import sys
+import time
+from datetime import date
+
+import season_cache
+from db import DB_BACKEND, get_db_connection
+
+CHUNK_SIZE = 5000  # pick ids per UPDATE
+
+# Age on %s (today) from birth_date, in each backend's date functions
+AGE = {
+    'mysql': "TIMESTAMPDIFF(YEAR, birth_date, %s)",
+    'sqlite': "(CAST(strftime('%Y', %s) AS INTEGER) - CAST(strftime('%Y', birth_date) AS INTEGER)"
+              " - (strftime('%m-%d', %s) < strftime('%m-%d', birth_date)))",
+}
+
+STALE = """
+    death_date IS NULL AND birth_date IS NOT NULL AND id >= %s AND id < %s
+    AND (age IS NULL OR age <> {age})
+"""
+
+
+def recompute(chunk_size=CHUNK_SIZE, today=None):
+    """Update stale ages chunk by chunk; returns (rows updated, seconds)"""
+    started = time.monotonic()
+    today = (today or date.today()).isoformat()
+    age = AGE[DB_BACKEND]
+    today_params = (today,) * age.count('%s')
+    stale = STALE.format(age=age)
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT MIN(id) AS low, MAX(id) AS high FROM picks WHERE death_date IS NULL")
+        bounds = cursor.fetchone()
+    if bounds['low'] is None:
+        return 0, time.monotonic() - started
+
+    updated = 0
+    for low in range(bounds['low'], bounds['high'] + 1, chunk_size):
+        params = (low, low + chunk_size) + today_params
+        with get_db_connection(write=True) as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(f"SELECT DISTINCT season_year FROM picks WHERE {stale}", params)
+            seasons = [row['season_year'] for row in cursor.fetchall()]
+            if not seasons:
+                continue
+            cursor.execute(f"UPDATE picks SET age = {age} WHERE {stale}", today_params + params)
+            updated += cursor.rowcount
+            for season_year in seasons:
+                season_cache.bump_version(cursor, season_year)
+            conn.commit()
+    return updated, time.monotonic() - started
+
+
+if __name__ == '__main__':
+    chunk_size = int(sys.argv[1]) if len(sys.argv) > 1 else CHUNK_SIZE
+    updated, elapsed = recompute(chunk_size)
+    print(f"Updated the age of {updated} living picks in {elapsed:.2f}s ({chunk_size} ids per chunk)")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Carry living picks over into a new season.
+
+Usage: python3 rollover.py <season_year> [participant_id]
+
+Everyone's picks from the previous season that are still alive are copied
+into ``season_year`` with one INSERT ... SELECT, skipping any name the
+participant has already picked there under any spelling. Without a
+participant id the whole league is rolled over at once; the dashboard's
+"Import from last year" button runs the same statement for one participant.
+Running it twice does nothing the second time.
+"""
+import sys
+
+import names
+import season_cache
+from db import get_db_connection
+
+ROLLOVER = """
+    INSERT INTO picks (participant_id, celebrity_name, season_year, age, birth_date, wikipedia_url,
+                       description, celebrity_id, name_key)
+    SELECT p.participant_id, p.celebrity_name, %s, p.age, p.birth_date, p.wikipedia_url,
+           p.description, COALESCE(p.celebrity_id, n.page_id), p.name_key
+    FROM picks p
+    LEFT JOIN celebrity_names n ON n.name_key = p.name_key
+    WHERE p.season_year = %s AND p.death_date IS NULL AND p.name_key IS NOT NULL {participant}
+      AND NOT EXISTS (
+          SELECT 1 FROM picks q
+          WHERE q.participant_id = p.participant_id AND q.season_year = %s AND q.name_key = p.name_key
+      )
+"""
+
+
+def fill_name_keys(cursor, season_years, participant_id=None):
+    """Give picks in these seasons that predate name_key one, so SQL can compare names.
+
+    A second pick of the same name by the same participant in a season keeps
+    a NULL key rather than tripping the unique index.
+    """
+    placeholders = ', '.join(['%s'] * len(season_years))
+    params = tuple(season_years)
+    participant = ''
+    if participant_id is not None:
+        participant = 'AND participant_id = %s'
+        params += (participant_id,)
+    cursor.execute(f"""
+        SELECT id, participant_id, season_year, celebrity_name, name_key FROM picks
+        WHERE season_year IN ({placeholders}) {participant}
+        ORDER BY id
+    """, params)
+    taken = set()
+    missing = []
+    for pick in cursor.fetchall():
+        if pick['name_key'] is not None:
+            taken.add((pick['participant_id'], pick['season_year'], pick['name_key']))
+        else:
+            missing.append(pick)
+
+    updates = []
+    for pick in missing:
+        key = (pick['participant_id'], pick['season_year'], names.normalize(pick['celebrity_name']))
+        if key[2] and key not in taken:
+            taken.add(key)
+            updates.append((key[2], pick['id']))
+    cursor.executemany("UPDATE picks SET name_key = %s WHERE id = %s", updates)
+    return len(updates)
+
+
+def roll_over(cursor, season_year, participant_id=None):
+    """Copy the previous season's living picks into season_year; returns how many were added"""
+    fill_name_keys(cursor, (season_year - 1, season_year), participant_id)
+    params = (season_year, season_year - 1)
+    participant = ''
+    if participant_id is not None:
+        participant = 'AND p.participant_id = %s'
+        params += (participant_id,)
+    cursor.execute(ROLLOVER.format(participant=participant), params + (season_year,))
+    added = cursor.rowcount
+    if added:
+        season_cache.bump_version(cursor, season_year)
+    return added
+
+
+def main(season_year, participant_id=None):
+    with get_db_connection(write=True) as conn:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT season_year FROM season_config WHERE season_year = %s", (season_year,))
+        if cursor.fetchone() is None:
+            cursor.execute("""
+                INSERT INTO season_config (season_year, end_date)
+                VALUES (%s, %s)
+            """, (season_year, f'{season_year}-12-31 23:59:59'))
+        added = roll_over(cursor, season_year, participant_id)
+        conn.commit()
+    who = f"participant {participant_id}" if participant_id is not None else "the league"
+    print(f"Rolled {added} living picks from {season_year - 1} into {season_year} for {who}")
+    return added
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    main(int(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else None)
@@ -9,6 +9,26 @@ CREATE TABLE IF NOT EXISTS participants (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- One row per real person, keyed by Wikipedia page id and shared by every pick of them
+CREATE TABLE IF NOT EXISTS celebrities (
+    page_id INT PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    birth_date DATE DEFAULT NULL,
+    death_date DATE DEFAULT NULL,
+    wikipedia_url TEXT DEFAULT NULL,
+    description TEXT DEFAULT NULL,
+    rev_id BIGINT DEFAULT NULL,  -- page revision the facts were read from (see death_watch.py)
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+-- Normalized spellings of a name (see names.py) -> the celebrity they resolved to
+CREATE TABLE IF NOT EXISTS celebrity_names (
+    name_key VARCHAR(255) PRIMARY KEY,
+    page_id INT NOT NULL,
+    FOREIGN KEY (page_id) REFERENCES celebrities(page_id) ON DELETE CASCADE
+);
+
 -- Celebrity picks table
 CREATE TABLE IF NOT EXISTS picks (
     id INT PRIMARY KEY AUTO_INCREMENT,
@@ -17,19 +37,32 @@ CREATE TABLE IF NOT EXISTS picks (
     birth_date DATE DEFAULT NULL,
     age INT DEFAULT NULL,
     death_date DATE DEFAULT NULL,
-    death_age INT DEFAULT NULL,
-    points INT DEFAULT 0,
+    -- death_age and points are derived from the dates (or the stored age if there's no birth date)
+    death_age INT GENERATED ALWAYS AS (CASE
+        WHEN death_date IS NULL THEN NULL
+        WHEN birth_date IS NULL THEN COALESCE(age, 0)
+        ELSE TIMESTAMPDIFF(YEAR, birth_date, death_date)
+    END) STORED,
+    points INT GENERATED ALWAYS AS (CASE WHEN death_date IS NULL THEN 0 ELSE GREATEST(0, 100 - death_age) END) STORED,
     is_first_blood TINYINT DEFAULT 0,
     season_year INT NOT NULL,
     wikipedia_url TEXT DEFAULT NULL,
     description TEXT DEFAULT NULL,
+    celebrity_id INT DEFAULT NULL,
+    name_key VARCHAR(255) DEFAULT NULL,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    FOREIGN KEY (participant_id) REFERENCES participants(id) ON DELETE CASCADE
+    FOREIGN KEY (participant_id) REFERENCES participants(id) ON DELETE CASCADE,
+    FOREIGN KEY (celebrity_id) REFERENCES celebrities(page_id) ON DELETE SET NULL
 );
 
 CREATE INDEX idx_season ON picks(season_year);
 CREATE INDEX idx_participant_season ON picks(participant_id, season_year);
+CREATE INDEX idx_season_updated ON picks(season_year, updated_at);
+CREATE INDEX idx_picks_celebrity ON picks(celebrity_id);
+CREATE INDEX idx_picks_name_key ON picks(name_key);
+CREATE UNIQUE INDEX idx_picks_participant_name ON picks(participant_id, season_year, name_key);  -- one pick per name (rollover.py)
+CREATE INDEX idx_picks_season_death ON picks(season_year, death_date);  -- First Blood seek (scoring.py)
 
 -- Season configuration table
 CREATE TABLE IF NOT EXISTS season_config (
@@ -38,6 +71,91 @@ CREATE TABLE IF NOT EXISTS season_config (
     end_date DATETIME NOT NULL,
     first_blood_winner_id INT DEFAULT NULL,
     picks_locked TINYINT DEFAULT 0,
+    data_version INT NOT NULL DEFAULT 0,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (first_blood_winner_id) REFERENCES participants(id) ON DELETE SET NULL
 );
+
+-- Deltas pushed to open dashboards over Server-Sent Events
+CREATE TABLE IF NOT EXISTS pick_events (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    season_year INT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Background Wikipedia lookups queued by /lookup_age
+CREATE TABLE IF NOT EXISTS lookup_jobs (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    pick_id INT NOT NULL,
+    celebrity_name VARCHAR(255) NOT NULL,
+    status VARCHAR(16) NOT NULL DEFAULT 'queued',
+    attempts INT NOT NULL DEFAULT 0,
+    run_after DATETIME NOT NULL,
+    locked_until DATETIME DEFAULT NULL,
+    result TEXT DEFAULT NULL,
+    error TEXT DEFAULT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (pick_id) REFERENCES picks(id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_lookup_jobs_status ON lookup_jobs(status, run_after);
+CREATE INDEX idx_lookup_jobs_pick ON lookup_jobs(pick_id, status);
+
+-- One row per normalized name being looked up; the lease and shared result behind single_flight.py
+CREATE TABLE IF NOT EXISTS lookup_flights (
+    name_key VARCHAR(255) PRIMARY KEY,
+    owner VARCHAR(255) NOT NULL,
+    locked_until DATETIME DEFAULT NULL,
+    result TEXT DEFAULT NULL,
+    fetched_at DATETIME DEFAULT NULL
+);
+
+-- Per-season leaderboard row for each participant, kept in step with picks by the triggers below
+-- (python3 standings.py check|rebuild verifies or recomputes it)
+CREATE TABLE IF NOT EXISTS standings (
+    participant_id INT NOT NULL,
+    season_year INT NOT NULL,
+    pick_count INT NOT NULL DEFAULT 0,
+    total_points INT NOT NULL DEFAULT 0,
+    deaths_count INT NOT NULL DEFAULT 0,
+    first_blood TINYINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (participant_id, season_year),
+    FOREIGN KEY (participant_id) REFERENCES participants(id) ON DELETE CASCADE
+);
+
+-- The dashboard reads a season's leaderboard straight off this index, already in rank order
+CREATE INDEX idx_standings_rank ON standings(season_year, total_points DESC, deaths_count DESC);
+
+DELIMITER //
+CREATE TRIGGER standings_after_insert AFTER INSERT ON picks FOR EACH ROW
+BEGIN
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT NEW.participant_id, NEW.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = NEW.participant_id AND season_year = NEW.season_year;
+END//
+
+-- A pick can move between participants or seasons, so both rows are recomputed
+CREATE TRIGGER standings_after_update AFTER UPDATE ON picks FOR EACH ROW
+BEGIN
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT OLD.participant_id, OLD.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = OLD.participant_id AND season_year = OLD.season_year;
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT NEW.participant_id, NEW.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = NEW.participant_id AND season_year = NEW.season_year;
+END//
+
+CREATE TRIGGER standings_after_delete AFTER DELETE ON picks FOR EACH ROW
+BEGIN
+    REPLACE INTO standings (participant_id, season_year, pick_count, total_points, deaths_count, first_blood)
+    SELECT OLD.participant_id, OLD.season_year, COUNT(*), COALESCE(SUM(points), 0),
+           COUNT(death_date), COALESCE(MAX(is_first_blood), 0)
+    FROM picks WHERE participant_id = OLD.participant_id AND season_year = OLD.season_year;
+END//
+DELIMITER ;
@@ -0,0 +1,81 @@
+"""Scoring a death: First Blood, and recording deaths so the database can score them.
+
+``death_age`` and ``points`` are generated columns derived from a pick's
+birth and death dates (see the schema files), so recording a death is a
+single-column UPDATE and a corrected date rescores itself.
+
+Every writer that records or changes a death goes through ``score_deaths``
+or ``clear_death`` inside its own transaction. Both start by locking the
+season's ``season_config`` row, so two deaths landing at once are scored
+one after the other and can't both claim First Blood. First Blood is then
+re-resolved from the season's earliest death date: every pick that died on
+that date shares it, and the season's recorded winner owns the first of
+them by pick id. ``idx_picks_season_death`` makes that an index seek.
+"""
+
+
+def lock_season(cursor, season_year):
+    """Serialize scoring for a season until the transaction ends"""
+    cursor.execute("SELECT id FROM season_config WHERE season_year = %s FOR UPDATE", (season_year,))
+    cursor.fetchall()
+
+
+def score_deaths(cursor, season_year, deaths, living_only=False):
+    """Record deaths as [(pick_id, death_date)] in one season and re-resolve First Blood.
+
+    With ``living_only``, picks that already have a death are left alone.
+    Returns the pick ids that hold First Blood afterwards.
+    """
+    lock_season(cursor, season_year)
+    cursor.executemany(f"""
+        UPDATE picks SET death_date = %s
+        WHERE id = %s AND season_year = %s{' AND death_date IS NULL' if living_only else ''}
+    """, [(death_date, pick_id, season_year) for pick_id, death_date in deaths])
+    return resolve_first_blood(cursor, season_year)
+
+
+def clear_death(cursor, season_year, pick_id):
+    """Undo a pick's death; First Blood passes to the next earliest death, if any"""
+    lock_season(cursor, season_year)
+    cursor.execute("""
+        UPDATE picks SET death_date = NULL, is_first_blood = 0
+        WHERE id = %s
+    """, (pick_id,))
+    return resolve_first_blood(cursor, season_year)
+
+
+def resolve_first_blood(cursor, season_year):
+    """Flag the picks on the season's earliest death date; call with the season locked"""
+    cursor.execute("""
+        SELECT id, participant_id, death_date FROM picks
+        WHERE season_year = %s AND death_date IS NOT NULL
+        ORDER BY death_date, id
+        LIMIT 1
+        FOR UPDATE
+    """, (season_year,))
+    first = cursor.fetchone()
+    if first is None:
+        cursor.execute("""
+            UPDATE season_config SET first_blood_winner_id = NULL
+            WHERE season_year = %s AND first_blood_winner_id IS NOT NULL
+        """, (season_year,))
+        return []
+
+    # Both are range scans over the season's deaths, and only touch picks whose flag changes
+    cursor.execute("""
+        UPDATE picks SET is_first_blood = 0
+        WHERE season_year = %s AND death_date > %s AND is_first_blood = 1
+    """, (season_year, first['death_date']))
+    cursor.execute("""
+        UPDATE picks SET is_first_blood = 1
+        WHERE season_year = %s AND death_date = %s AND is_first_blood = 0
+    """, (season_year, first['death_date']))
+    cursor.execute("""
+        UPDATE season_config SET first_blood_winner_id = %s
+        WHERE season_year = %s
+    """, (first['participant_id'], season_year))
+
+    cursor.execute("""
+        SELECT id FROM picks WHERE season_year = %s AND death_date = %s ORDER BY id
+    """, (season_year, first['death_date']))
+    return [row['id'] for row in cursor.fetchall()]
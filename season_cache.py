@@ -0,0 +1,74 @@
+"""Per-season cache of dashboard query results.
+
+Every write route bumps ``season_config.data_version`` in the same
+transaction as its change. Cached results are stored against a watermark
+made of that version plus the season's pick count and latest
+``picks.updated_at``, so a reader only needs the season_config row and one
+indexed aggregate to know whether the cached leaderboard is still current.
+The watermark lives in the database, so it stays correct when several
+worker processes each keep their own cache, and it also notices picks
+changed by the batch scripts.
+"""
+from datetime import datetime
+import threading
+
+_lock = threading.Lock()
+_entries = {}  # season_year -> (watermark, value)
+_hits = 0
+_misses = 0
+
+
+def watermark(cursor, season):
+    """Cheap fingerprint of a season's data: (data_version, pick count, last update)
+
+    Covered by idx_season_updated, so it never touches the pick rows themselves.
+    """
+    cursor.execute("""
+        SELECT COUNT(*) AS pick_count, MAX(updated_at) AS last_update
+        FROM picks
+        WHERE season_year = %s
+    """, (season['season_year'],))
+    row = cursor.fetchone()
+    return (season['data_version'], row['pick_count'], _as_datetime(row['last_update']))
+
+
+def _as_datetime(value):
+    # SQLite hands back aggregates over DATETIME columns as plain strings
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.strptime(str(value)[:19], '%Y-%m-%d %H:%M:%S')
+
+
+def get(season_year, mark):
+    """Return the cached value for this season watermark, or None"""
+    global _hits, _misses
+    with _lock:
+        entry = _entries.get(season_year)
+        if entry and entry[0] == mark:
+            _hits += 1
+            return entry[1]
+        _misses += 1
+        return None
+
+
+def put(season_year, mark, value):
+    with _lock:
+        _entries[season_year] = (mark, value)
+
+
+def bump_version(cursor, season_year):
+    """Invalidate cached results for a season; call inside the write's transaction"""
+    cursor.execute("""
+        UPDATE season_config
+        SET data_version = data_version + 1, updated_at = CURRENT_TIMESTAMP
+        WHERE season_year = %s
+    """, (season_year,))
+
+
+def stats():
+    with _lock:
+        return {
+            'seasons': len(_entries),
+            'hits': _hits,
+            'misses': _misses,
+        }
@@ -0,0 +1,147 @@
+"""Build everything the dashboard shows for a season from its picks and standings"""
+import standings
+
+# Bar chart segment colours, cycled per participant
+SEGMENT_COLORS = ['#8b0000', '#b05a2a', '#7b3a6e', '#2a5298', '#4a6741', '#8b6914', '#5a4a8a', '#b22222', '#cd853f']
+
+
+def load(cursor, season_year):
+    """Fetch a season's picks joined to participants and summarize them"""
+    # LEFT JOIN so participants without picks still get a leaderboard row
+    cursor.execute("""
+        SELECT
+            p.id AS participant_id,
+            p.name AS participant_name,
+            pk.id, pk.celebrity_name, pk.birth_date, pk.age, pk.death_date,
+            pk.death_age, pk.points, pk.season_year, pk.wikipedia_url, pk.description
+        FROM participants p
+        LEFT JOIN picks pk ON pk.participant_id = p.id AND pk.season_year = %s
+        ORDER BY p.name, pk.celebrity_name
+    """, (season_year,))
+    rows = cursor.fetchall()
+    return summarize(rows, standings.load(cursor, season_year))
+
+
+def _new_card(participant_id, name):
+    return {
+        'id': participant_id,
+        'name': name,
+        'picks': [],
+        'pick_count': 0,
+        'deaths_count': 0,
+        'total_points': 0,
+        'avg_age': None,
+        'oldest': None,
+        'youngest': None,
+        'best_pick': None,
+        'segments': [],
+        'bar_points': 0,
+        'bar_width': 0,
+    }
+
+
+def summarize(rows, ranking=None):
+    """One pass over rows ordered by participant name, then celebrity name.
+
+    Returns the leaderboard, per-participant cards (picks, stats and bar
+    chart segments) and the First Blood picks. ``ranking`` is the season's
+    standings rows in leaderboard order; without it the leaderboard is
+    ranked from the picks.
+    """
+    cards = {}
+    age_totals = {}
+    first_blood_picks = []
+    earliest_death = None
+
+    for row in rows:
+        card = cards.get(row['participant_id'])
+        if card is None:
+            card = cards[row['participant_id']] = _new_card(row['participant_id'], row['participant_name'])
+            age_totals[card['id']] = [0, 0]
+        if row['id'] is None:
+            continue
+
+        pick = row
+        pick['is_first_blood'] = False
+        pick['points'] = pick['points'] or 0
+        card['picks'].append(pick)
+        card['pick_count'] += 1
+        card['total_points'] += pick['points']
+
+        if pick['age']:
+            totals = age_totals[card['id']]
+            totals[0] += pick['age']
+            totals[1] += 1
+            if card['oldest'] is None or pick['age'] > card['oldest']['age']:
+                card['oldest'] = pick
+            if card['youngest'] is None or pick['age'] < card['youngest']['age']:
+                card['youngest'] = pick
+
+        if pick['death_date']:
+            card['deaths_count'] += 1
+            card['segments'].append(pick)
+            if card['best_pick'] is None or pick['points'] > card['best_pick']['points']:
+                card['best_pick'] = pick
+            # First Blood is every pick sharing the season's earliest death date
+            if earliest_death is None or pick['death_date'] < earliest_death:
+                earliest_death = pick['death_date']
+                first_blood_picks = [pick]
+            elif pick['death_date'] == earliest_death:
+                first_blood_picks.append(pick)
+
+    for pick in first_blood_picks:
+        pick['is_first_blood'] = True
+
+    participants = list(cards.values())
+    if ranking is None:
+        leaderboard = sorted(participants, key=lambda c: (-c['total_points'], -c['deaths_count']))
+    else:
+        leaderboard = []
+        for standing in ranking:
+            card = cards.get(standing['participant_id'])
+            if card is not None:
+                card['total_points'] = standing['total_points']
+                card['deaths_count'] = standing['deaths_count']
+                leaderboard.append(card)
+        # Participants without a pick this season have no standings row
+        ranked = {card['id'] for card in leaderboard}
+        leaderboard += [card for card in participants if card['id'] not in ranked]
+    max_points = max([1] + [c['total_points'] for c in participants])
+
+    for card in participants:
+        age_sum, age_count = age_totals[card['id']]
+        card['avg_age'] = round(age_sum / age_count, 1) if age_count else None
+        dead = sorted(card['segments'], key=lambda pk: pk['points'], reverse=True)
+        card['segments'] = [
+            {'pick': pk, 'color': SEGMENT_COLORS[i % len(SEGMENT_COLORS)]}
+            for i, pk in enumerate(dead)
+        ]
+        card['bar_points'] = sum(pk['points'] for pk in dead)
+        card['bar_width'] = round(card['bar_points'] / max_points * 100, 1)
+
+    first_blood_names = []
+    for pick in first_blood_picks:
+        if pick['participant_name'] not in first_blood_names:
+            first_blood_names.append(pick['participant_name'])
+
+    return {
+        'leaderboard': leaderboard,
+        'participants': participants,
+        'first_blood_picks': first_blood_picks,
+        'first_blood_names': first_blood_names,
+        'any_deaths': any(c['deaths_count'] for c in participants),
+    }
+
+
+def visible_cards(summary, picks_locked, viewer_id):
+    """Participant cards the viewer may see.
+
+    While a season's picks are unlocked (draft mode) each user only sees
+    their own picks; everyone else's card is shown empty.
+    """
+    if picks_locked:
+        return summary['participants']
+    return [
+        card if card['id'] == viewer_id else _new_card(card['id'], card['name'])
+        for card in summary['participants']
+    ]
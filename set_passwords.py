@@ -2,13 +2,15 @@
 """
 Run once on PythonAnywhere to set up initial usernames and passwords.
 Usage: python3 set_passwords.py
+
+Writes to the SQLite database at DB_PATH (deathpool.db) like the
+PythonAnywhere deployment; set DB_BACKEND=mysql to use MySQL instead.
 """
-import sqlite3
 from werkzeug.security import generate_password_hash
-import os
 import getpass
+import os
 
-DB_PATH = os.environ.get('DB_PATH', 'deathpool.db')
+import db
 
 # Map participant names to usernames — edit usernames here if desired
 users = [
@@ -17,14 +19,14 @@ users = [
     ('Oost', 'oost'),
 ]
 
-conn = sqlite3.connect(DB_PATH)
+conn = db.connect(os.environ.get('DB_BACKEND', 'sqlite'))
 cursor = conn.cursor()
 
 for name, username in users:
     password = getpass.getpass(f"Set password for {name} (username: {username}): ")
     password_hash = generate_password_hash(password)
     cursor.execute(
-        "UPDATE participants SET username = ?, password_hash = ? WHERE name = ?",
+        "UPDATE participants SET username = %s, password_hash = %s WHERE name = %s",
         (username, password_hash, name)
     )
     if cursor.rowcount == 0:
@@ -0,0 +1,178 @@
+"""Single-flight Wikipedia lookups: concurrent requests for one name share a fetch.
+
+When a big name dies, everyone who picked them hits "Lookup Age" at once
+and each pick gets its own job. ``SingleFlight`` wraps the lookup function
+the workers call, keyed by normalized name:
+
+- Threads in one process asking for a name that is already being fetched
+  wait for that fetch and get its result.
+- Across worker processes, the fetching thread holds a lease on the name's
+  row in ``lookup_flights``. Other processes poll the row instead of
+  calling Wikipedia, and once the leader stores its result there they
+  reuse it for SHARE_FOR seconds. The leader renews its lease while the
+  fetch runs, however long Wikipedia retries take; a lease that lapses
+  because its process died is taken over by the next caller.
+"""
+import json
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+
+import names
+from db import as_datetime, get_db_connection
+
+LEASE = timedelta(seconds=int(os.environ.get('LOOKUP_FLIGHT_LEASE', 30)))        # renewed every third of this while fetching
+SHARE_FOR = timedelta(seconds=int(os.environ.get('LOOKUP_FLIGHT_SHARE', 60)))    # how long followers reuse a result
+POLL_INTERVAL = 0.2  # seconds between checks on another process's fetch
+
+OWNER = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Wraps ``fetch(name)`` so concurrent calls for the same normalized name share one"""
+
+    def __init__(self, fetch, lease=LEASE, share_for=SHARE_FOR):
+        self.fetch = fetch
+        self.lease = lease
+        self.share_for = share_for
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {'fetches': 0, 'shared_in_process': 0, 'shared_across_processes': 0, 'lease_takeovers': 0}
+
+    def _count(self, key):
+        with self._lock:
+            self._stats[key] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
+
+    def __call__(self, name):
+        key = names.normalize(name) or name
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            self._count('shared_in_process')
+            if call.error:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._across_processes(key, name)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def _across_processes(self, key, name):
+        # Wait while another process's lease is live; _claim takes it over once it lapses
+        while True:
+            state, result = self._claim(key)
+            if state == 'shared':
+                self._count('shared_across_processes')
+                return result
+            if state == 'leader':
+                break
+            time.sleep(POLL_INTERVAL)
+
+        self._count('fetches')
+        stop = threading.Event()
+        renewer = threading.Thread(target=self._renew, args=(key, stop), name='lookup-flight-lease', daemon=True)
+        renewer.start()
+        try:
+            result = self.fetch(name)
+        except Exception:
+            self._finish(key, None, failed=True)
+            raise
+        finally:
+            stop.set()
+            renewer.join()
+        self._finish(key, result)
+        return result
+
+    def _renew(self, key, stop):
+        """Push our lease on a name forward until ``stop`` is set"""
+        while not stop.wait(self.lease.total_seconds() / 3):
+            try:
+                with get_db_connection(write=True) as conn:
+                    cursor = conn.cursor(dictionary=True)
+                    cursor.execute("""
+                        UPDATE lookup_flights SET locked_until = %s
+                        WHERE name_key = %s AND owner = %s AND locked_until IS NOT NULL
+                    """, (datetime.now() + self.lease, key, OWNER))
+                    conn.commit()
+            except Exception as e:
+                print(f"Error renewing the lookup lease on {key}: {type(e).__name__}: {e}")
+
+    def _claim(self, key):
+        """('shared', result), ('leader', None) or ('waiting', None) for a name"""
+        now = datetime.now()
+        with get_db_connection(write=True) as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute("""
+                SELECT locked_until, result, fetched_at FROM lookup_flights WHERE name_key = %s
+            """, (key,))
+            row = cursor.fetchone()
+            locked = row is not None and row['locked_until'] is not None and as_datetime(row['locked_until']) > now
+            if row and not locked and row['fetched_at'] and as_datetime(row['fetched_at']) >= now - self.share_for:
+                return 'shared', json.loads(row['result'])
+            if locked:
+                return 'waiting', None
+
+            if row is None:
+                try:
+                    cursor.execute("""
+                        INSERT INTO lookup_flights (name_key, owner, locked_until) VALUES (%s, %s, %s)
+                    """, (key, OWNER, now + self.lease))
+                except Exception:
+                    # Duplicate key: another process inserted the row first and holds the lease
+                    conn.rollback()
+                    return 'waiting', None
+            else:
+                # Conditional update so only one process takes a free or lapsed lease
+                cursor.execute("""
+                    UPDATE lookup_flights
+                    SET owner = %s, locked_until = %s
+                    WHERE name_key = %s AND (locked_until IS NULL OR locked_until <= %s)
+                """, (OWNER, now + self.lease, key, now))
+                if cursor.rowcount != 1:
+                    conn.rollback()
+                    return 'waiting', None
+            conn.commit()
+        if row is not None and row['locked_until'] is not None:
+            self._count('lease_takeovers')  # its holder stopped renewing it
+        return 'leader', None
+
+    def _finish(self, key, result, failed=False):
+        """Release the lease, publishing the result to other processes unless the fetch failed"""
+        with get_db_connection(write=True) as conn:
+            cursor = conn.cursor(dictionary=True)
+            if failed:
+                cursor.execute("""
+                    UPDATE lookup_flights SET locked_until = NULL WHERE name_key = %s AND owner = %s
+                """, (key, OWNER))
+            else:
+                cursor.execute("""
+                    UPDATE lookup_flights
+                    SET locked_until = NULL, result = %s, fetched_at = %s
+                    WHERE name_key = %s AND owner = %s
+                """, (json.dumps(result), datetime.now(), key, OWNER))
+            conn.commit()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Per-season leaderboard totals kept in the ``standings`` table.
+
+Usage: python3 standings.py check [season_year]
+       python3 standings.py rebuild [season_year]
+
+Triggers on ``picks`` (see the schema files) recompute a participant's row
+for a season whenever one of their picks is added, scored, moved or
+deleted, inside the same transaction, so every writer keeps it current
+without knowing it exists. The dashboard reads a season's ranking off
+``idx_standings_rank`` instead of aggregating picks.
+
+``check`` compares the table with totals computed from picks and exits
+non-zero on any difference; ``rebuild`` recomputes it from scratch, for a
+database that was written to before the triggers existed.
+"""
+import sys
+
+import season_cache
+from db import get_db_connection
+
+COLUMNS = ('pick_count', 'total_points', 'deaths_count', 'first_blood')
+
+# What standings should hold, straight from picks
+EXPECTED = """
+    SELECT participant_id, season_year, COUNT(*) AS pick_count, COALESCE(SUM(points), 0) AS total_points,
+           COUNT(death_date) AS deaths_count, COALESCE(MAX(is_first_blood), 0) AS first_blood
+    FROM picks
+    {where}
+    GROUP BY participant_id, season_year
+"""
+
+
+def load(cursor, season_year):
+    """A season's standings rows in leaderboard order"""
+    cursor.execute("""
+        SELECT participant_id, pick_count, total_points, deaths_count, first_blood
+        FROM standings
+        WHERE season_year = %s
+        ORDER BY total_points DESC, deaths_count DESC
+    """, (season_year,))
+    return cursor.fetchall()
+
+
+def _season_filter(season_year):
+    if season_year is None:
+        return '', ()
+    return 'WHERE season_year = %s', (season_year,)
+
+
+def check(cursor, season_year=None):
+    """[(participant_id, season_year, stored row or None, expected row or None)] that disagree"""
+    where, params = _season_filter(season_year)
+    cursor.execute(EXPECTED.format(where=where), params)
+    expected = {(row['participant_id'], row['season_year']): row for row in cursor.fetchall()}
+    cursor.execute(f"SELECT participant_id, season_year, {', '.join(COLUMNS)} FROM standings {where}", params)
+    stored = {(row['participant_id'], row['season_year']): row for row in cursor.fetchall()}
+
+    problems = []
+    for key in sorted(set(expected) | set(stored)):
+        want = expected.get(key)
+        have = stored.get(key)
+        if want is None and not any(have[column] for column in COLUMNS):
+            continue  # all of a participant's picks were deleted; the zeroed row is harmless
+        if want is None or have is None or any(int(have[column]) != int(want[column]) for column in COLUMNS):
+            problems.append((key[0], key[1], have, want))
+    return problems
+
+
+def rebuild(cursor, season_year=None):
+    """Recompute standings from picks; returns the number of rows written"""
+    where, params = _season_filter(season_year)
+    cursor.execute(f"DELETE FROM standings {where}", params)
+    cursor.execute(f"""
+        INSERT INTO standings (participant_id, season_year, {', '.join(COLUMNS)})
+        {EXPECTED.format(where=where)}
+    """, params)
+    written = cursor.rowcount
+    cursor.execute(f"SELECT DISTINCT season_year FROM standings {where}", params)
+    for row in cursor.fetchall():
+        season_cache.bump_version(cursor, row['season_year'])
+    return written
+
+
+def main(command, season_year=None):
+    label = f"season {season_year}" if season_year else "all seasons"
+    with get_db_connection(write=command == 'rebuild') as conn:
+        cursor = conn.cursor(dictionary=True)
+        if command == 'rebuild':
+            written = rebuild(cursor, season_year)
+            conn.commit()
+            print(f"Rebuilt {written} standings rows for {label}")
+            return 0
+        problems = check(cursor, season_year)
+    for participant_id, year, have, want in problems:
+        have = {column: have[column] for column in COLUMNS} if have else None
+        want = {column: int(want[column]) for column in COLUMNS} if want else None
+        print(f"  ✗ participant {participant_id}, season {year}: stored {have}, picks say {want}")
+    print(f"Standings for {label}: {len(problems)} rows out of step"
+          + (", run 'python3 standings.py rebuild' to fix" if problems else ""))
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in ('check', 'rebuild'):
+        print(__doc__)
+        sys.exit(1)
+    sys.exit(main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else None))
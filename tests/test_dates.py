@@ -0,0 +1,84 @@
+"""Date validation on the death-date routes.
+
+Run with: python3 -m unittest discover tests
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'deathpool.db')
+os.environ['DB_BACKEND'] = 'sqlite'
+os.environ['DB_PATH'] = DB_PATH
+sys.path.insert(0, ROOT)
+
+with sqlite3.connect(DB_PATH) as conn, open(os.path.join(ROOT, 'schema_sqlite.sql')) as f:
+    conn.executescript(f.read())
+    conn.execute("INSERT INTO participants (id, name, username) VALUES (1, 'Jim', 'jim')")
+
+import app  # noqa: E402  (reads DB_BACKEND and DB_PATH on import)
+
+DEATH_DATE = '2025-02-01'
+
+
+class DeathDateTest(unittest.TestCase):
+
+    def setUp(self):
+        conn = sqlite3.connect(DB_PATH)
+        conn.execute("DELETE FROM picks")
+        conn.execute("""
+            INSERT INTO picks (id, participant_id, celebrity_name, season_year, birth_date, age, death_date)
+            VALUES (5, 1, 'Gene Hackman', 2025, '1930-01-30', 95, ?)
+        """, (DEATH_DATE,))
+        conn.commit()
+        conn.close()
+
+        self.client = app.app.test_client()
+        with self.client.session_transaction() as session:
+            session['_user_id'] = '1'
+
+    def death_date(self):
+        conn = sqlite3.connect(DB_PATH)
+        try:
+            return conn.execute("SELECT death_date FROM picks WHERE id = 5").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_mark_death_without_a_date(self):
+        response = self.client.post('/mark_death/5', data={'season_year': 2025})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.death_date(), DEATH_DATE)
+
+    def test_mark_death_with_an_empty_date(self):
+        response = self.client.post('/mark_death/5', data={'death_date': '', 'season_year': 2025})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.death_date(), DEATH_DATE)
+
+    def test_mark_death_with_a_malformed_date(self):
+        response = self.client.post('/mark_death/5', data={'death_date': '2025-13-40', 'season_year': 2025})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.death_date(), DEATH_DATE)
+
+    def test_update_date_without_a_date(self):
+        response = self.client.post('/update_date/5', json={'date_type': 'death', 'new_date': ''})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.death_date(), DEATH_DATE)
+
+    def test_update_date_with_a_malformed_date(self):
+        for new_date in ('01/02/2025', 'yesterday'):
+            response = self.client.post('/update_date/5', json={'date_type': 'death', 'new_date': new_date})
+            self.assertEqual(response.status_code, 400)
+        response = self.client.post('/update_date/5', json={'date_type': 'birth', 'new_date': '1930-02-30'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.death_date(), DEATH_DATE)
+
+    def test_valid_date_is_recorded(self):
+        response = self.client.post('/mark_death/5', data={'death_date': '2025-03-01', 'season_year': 2025})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.death_date(), '2025-03-01')
+
+
+if __name__ == '__main__':
+    unittest.main()
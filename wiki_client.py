@@ -0,0 +1,550 @@
+"""Shared Wikipedia client used by the app and the batch scripts.
+
+All requests go through one keep-alive ``requests.Session``. Page wikitext
+is cached on disk keyed by title and revision id, so looking someone up
+again costs one small request unless their article has been edited.
+Names that Wikipedia can't find are cached too, for NEGATIVE_TTL seconds.
+Only the lead section (section 0), where the infobox lives, is downloaded;
+the full article is fetched only for pages whose lead has no infobox.
+
+Where the dates come from is pluggable: the default ``wikitext`` backend
+parses the article's infobox, and ``wikidata`` (see wikidata.py) reads
+structured birth and death claims instead. LOOKUP_BACKEND picks one.
+
+If a local index built from a Wikipedia dump (see dump_import.py) is
+present, ``lookup_many`` answers from it first and only asks the API about
+the names it doesn't have. Otherwise it resolves and fetches up to
+BATCH_SIZE titles per request,
+and ``lookup_batches`` runs those chunks on a thread pool, which is what
+the batch scripts use to refresh a whole season. Every request, from any
+thread, passes through one token bucket (WIKI_RATE per second) and is
+retried with exponential backoff on 429s, 5xx responses and maxlag errors.
+"""
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import requests
+
+import infobox
+import wiki_index
+
+API_URL = os.environ.get('WIKIPEDIA_API_URL', 'https://en.wikipedia.org/w/api.php')
+CACHE_PATH = os.environ.get('WIKI_CACHE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wiki_cache.db'))
+NEGATIVE_TTL = int(os.environ.get('WIKI_NEGATIVE_TTL', 24 * 3600))
+TIMEOUT = 10
+BATCH_SIZE = 50  # most titles the API accepts per query
+RATE = float(os.environ.get('WIKI_RATE', 5))               # requests per second, shared by every thread
+BURST = int(os.environ.get('WIKI_BURST', 5))
+MAXLAG = int(os.environ.get('WIKI_MAXLAG', 5))             # replica lag (s) at which the API asks us to wait
+MAX_RETRIES = int(os.environ.get('WIKI_MAX_RETRIES', 5))
+BACKOFF_BASE = float(os.environ.get('WIKI_BACKOFF_BASE', 1))  # seconds; doubles per retry
+CONCURRENCY = int(os.environ.get('WIKI_CONCURRENCY', 4))   # threads used by lookup_batches
+BACKEND = os.environ.get('LOOKUP_BACKEND', 'wikitext')     # where birth and death dates come from
+
+session = requests.Session()
+session.headers.update({
+    'User-Agent': 'DeathpoolApp/1.0 (Educational project; Python/Requests)'
+})
+session.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=max(CONCURRENCY, 10)))
+
+
+class WikipediaBusy(Exception):
+    """Wikipedia kept asking us to back off (maxlag) after MAX_RETRIES retries"""
+
+
+class TokenBucket:
+    """Blocks callers so requests from all threads average ``rate`` per second"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+bucket = TokenBucket(RATE, BURST)
+
+_stats_lock = threading.Lock()
+_stats = {
+    'requests': 0,
+    'page_hits': 0,
+    'page_misses': 0,
+    'negative_hits': 0,
+    'searches': 0,
+    'retries': 0,
+    'lookups': 0,
+    'bytes_received': 0,         # decoded response bodies, every request
+    'content_requests': 0,
+    'content_bytes': 0,          # the part of bytes_received spent on wikitext
+    'full_page_fallbacks': 0,    # pages whose lead section had no infobox
+    'wikidata_fallbacks': 0,     # pages the wikidata backend handed to wikitext
+    'index_hits': 0,             # names answered by the local dump index
+}
+_latencies = deque(maxlen=1000)  # recent request latencies in seconds
+_content_latencies = deque(maxlen=1000)
+
+
+def _count(key, n=1):
+    with _stats_lock:
+        _stats[key] += n
+
+
+def percentiles(samples):
+    """p50/p90/p99/max of latencies in seconds, as milliseconds"""
+    samples = sorted(samples)
+    if not samples:
+        return {'p50': None, 'p90': None, 'p99': None, 'max': None}
+    pick = lambda q: round(samples[min(len(samples) - 1, int(len(samples) * q))] * 1000, 1)
+    return {'p50': pick(0.50), 'p90': pick(0.90), 'p99': pick(0.99), 'max': round(samples[-1] * 1000, 1)}
+
+
+def stats():
+    with _stats_lock:
+        lookups = _stats['lookups']
+        return dict(_stats,
+                    bytes_per_lookup=round(_stats['bytes_received'] / lookups) if lookups else None,
+                    request_ms=percentiles(_latencies),
+                    content_ms=percentiles(_content_latencies))
+
+
+def _backoff(attempt, retry_after=None):
+    _count('retries')
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = BACKOFF_BASE * 2 ** attempt
+        delay += random.uniform(0, delay / 2)
+    print(f"Wikipedia asked us to slow down, retrying in {delay:.1f}s")
+    time.sleep(delay)
+
+
+def api_get(params, content=False, url=API_URL):
+    """GET the MediaWiki API through the shared rate limiter.
+
+    Connection errors, 429s, 5xx responses and maxlag errors are retried
+    with exponential backoff, or after the server's Retry-After, up to
+    MAX_RETRIES times. Anything else raises straight away. ``content``
+    marks fetches of the date-bearing payload (wikitext or Wikidata claims),
+    whose size and latency are also counted apart.
+    """
+    params = dict(params, format='json', maxlag=MAXLAG)
+    for attempt in range(MAX_RETRIES + 1):
+        bucket.acquire()
+        start = time.monotonic()
+        try:
+            response = session.get(url, params=params, timeout=TIMEOUT)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == MAX_RETRIES:
+                raise
+            _backoff(attempt)
+            continue
+        finally:
+            _count('requests')
+            with _stats_lock:
+                _latencies.append(time.monotonic() - start)
+
+        size = len(response.content)
+        _count('bytes_received', size)
+        retry_after = response.headers.get('Retry-After')
+        if response.status_code == 429 or response.status_code >= 500:
+            if attempt == MAX_RETRIES:
+                response.raise_for_status()
+            _backoff(attempt, retry_after)
+            continue
+        response.raise_for_status()
+
+        data = response.json()
+        if data.get('error', {}).get('code') == 'maxlag':
+            if attempt == MAX_RETRIES:
+                raise WikipediaBusy(data['error'].get('info', 'maxlag'))
+            _backoff(attempt, retry_after)
+            continue
+        if content:
+            with _stats_lock:
+                _stats['content_requests'] += 1
+                _stats['content_bytes'] += size
+                _content_latencies.append(time.monotonic() - start)
+        return data
+
+
+class DiskCache:
+    """Page wikitext by (title, revision id) and failed searches, in a SQLite file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._ready = False
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._ready:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    title TEXT PRIMARY KEY,
+                    rev_id INTEGER NOT NULL,
+                    content TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS failed_searches (
+                    query TEXT PRIMARY KEY,
+                    fetched_at REAL NOT NULL
+                );
+            """)
+            self._ready = True
+        return conn
+
+    def get_page(self, title, rev_id):
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT content FROM pages WHERE title = ? AND rev_id = ?", (title, rev_id)).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def put_page(self, title, rev_id, content):
+        conn = self._connect()
+        try:
+            conn.execute("INSERT OR REPLACE INTO pages (title, rev_id, content, fetched_at) VALUES (?, ?, ?, ?)",
+                         (title, rev_id, content, time.time()))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def search_failed(self, query):
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT fetched_at FROM failed_searches WHERE query = ?", (query,)).fetchone()
+        finally:
+            conn.close()
+        return row is not None and time.time() - row[0] < NEGATIVE_TTL
+
+    def put_failed_search(self, query):
+        conn = self._connect()
+        try:
+            conn.execute("INSERT OR REPLACE INTO failed_searches (query, fetched_at) VALUES (?, ?)", (query, time.time()))
+            conn.commit()
+        finally:
+            conn.close()
+
+
+cache = DiskCache(CACHE_PATH)
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def query_titles(titles, content=False, **params):
+    """Run a prop query over up to BATCH_SIZE titles, following continuation.
+
+    Returns (pages keyed by title, {requested title: final title}), where
+    the final title has normalization and redirects applied.
+    """
+    request = dict(params, action='query', titles='|'.join(titles))
+    pages = {}
+    aliases = {}
+    while True:
+        data = api_get(request, content)
+        query = data.get('query', {})
+        for entry in query.get('normalized', []) + query.get('redirects', []):
+            aliases[entry['from']] = entry['to']
+        for page in query.get('pages', {}).values():
+            # Continued responses repeat the page with the props it still owed
+            pages.setdefault(page['title'], {}).update(page)
+        if 'continue' not in data:
+            break
+        request.update(data['continue'])
+
+    resolved = {}
+    for title in titles:
+        final = title
+        for _ in range(3):  # normalized -> redirect -> (rarely) normalized again
+            final = aliases.get(final, final)
+        resolved[title] = final
+    return pages, resolved
+
+
+def _page_info(page):
+    return {
+        'title': page['title'],
+        'page_id': page['pageid'],
+        'rev_id': page['revisions'][0]['revid'],
+        'description': page.get('description', ''),
+        'qid': page.get('pageprops', {}).get('wikibase_item'),
+    }
+
+
+def search_page(celebrity_name):
+    """Best search hit for a name with its current revision id and short description.
+
+    One request: the search runs as a generator, so the page's revision id
+    and description come back with it.
+    """
+    if cache.search_failed(celebrity_name):
+        _count('negative_hits')
+        return None
+    _count('searches')
+
+    data = api_get({
+        'action': 'query',
+        'generator': 'search',
+        'gsrsearch': celebrity_name,
+        'gsrlimit': 1,
+        'prop': 'revisions|description|pageprops',
+        'rvprop': 'ids',
+        'ppprop': 'wikibase_item',
+    })
+    pages = list(data.get('query', {}).get('pages', {}).values())
+    if not pages or 'revisions' not in pages[0]:
+        cache.put_failed_search(celebrity_name)
+        return None
+    return _page_info(pages[0])
+
+
+def resolve_pages(names):
+    """{name: page info or None} for a list of names.
+
+    Names are first tried as exact titles, BATCH_SIZE per request with
+    redirects followed; only names that miss or land on a disambiguation
+    page fall back to a search of their own.
+    """
+    found = {}
+    for chunk in _chunks(names, BATCH_SIZE):
+        pages, resolved = query_titles(chunk, prop='revisions|description|pageprops',
+                                       rvprop='ids', ppprop='disambiguation|wikibase_item', redirects=1)
+        for name in chunk:
+            page = pages.get(resolved[name])
+            if page and 'revisions' in page and 'disambiguation' not in page.get('pageprops', {}):
+                found[name] = _page_info(page)
+    for name in names:
+        if name not in found:
+            found[name] = search_page(name)
+    return found
+
+
+def _revisions(titles, **params):
+    """{title: (revid, wikitext)} for the current revisions of some titles"""
+    fetched, _ = query_titles(titles, content=True, prop='revisions', rvprop='ids|content', rvslots='main', **params)
+    revisions = {}
+    for title in titles:
+        page = fetched.get(title)
+        if page and 'revisions' in page:
+            revision = page['revisions'][0]
+            revisions[title] = (revision['revid'], revision['slots']['main']['*'])
+    return revisions
+
+
+def current_revisions(page_ids):
+    """{page_id: page info} with the current revision of each page, BATCH_SIZE per request.
+
+    Deleted pages are left out. The info has the page's current title, so
+    a renamed article is followed too.
+    """
+    found = {}
+    for chunk in _chunks(list(page_ids), BATCH_SIZE):
+        request = {
+            'action': 'query',
+            'pageids': '|'.join(str(page_id) for page_id in chunk),
+            'prop': 'revisions|description|pageprops',
+            'rvprop': 'ids',
+            'ppprop': 'wikibase_item',
+        }
+        pages = {}
+        while True:
+            data = api_get(request)
+            for page in data.get('query', {}).get('pages', {}).values():
+                pages.setdefault(page.get('pageid'), {}).update(page)
+            if 'continue' not in data:
+                break
+            request.update(data['continue'])
+        for page in pages.values():
+            if 'revisions' in page:
+                found[page['pageid']] = _page_info(page)
+    return found
+
+
+def fetch_contents(pages):
+    """{title: wikitext} for page infos, fetching uncached revisions BATCH_SIZE per request.
+
+    Only section 0 is requested; the few pages whose lead has no infobox
+    are fetched again in full. The cache keeps whichever text was used.
+    """
+    contents = {}
+    wanted = []
+    for page in pages:
+        content = cache.get_page(page['title'], page['rev_id'])
+        if content is not None:
+            _count('page_hits')
+            contents[page['title']] = content
+        elif page['title'] not in wanted:
+            _count('page_misses')
+            wanted.append(page['title'])
+
+    for chunk in _chunks(wanted, BATCH_SIZE):
+        revisions = _revisions(chunk, rvsection=0)
+        no_infobox = [title for title, (_, text) in revisions.items() if not infobox.has_infobox(text)]
+        if no_infobox:
+            _count('full_page_fallbacks', len(no_infobox))
+            revisions.update(_revisions(no_infobox))
+        for title, (rev_id, text) in revisions.items():
+            contents[title] = text
+            cache.put_page(title, rev_id, text)
+    return contents
+
+
+class WikitextBackend:
+    """Dates parsed from the infobox in each article's wikitext"""
+
+    name = 'wikitext'
+
+    def dates(self, pages):
+        """{title: (birth_date, death_date)} for page infos from resolve_pages"""
+        return {title: infobox.dates(text) for title, text in fetch_contents(pages).items()}
+
+
+wikitext = WikitextBackend()
+
+
+def get_backend(name=None):
+    """The lookup backend called ``name``, LOOKUP_BACKEND by default.
+
+    A backend has a ``dates(pages)`` method taking page infos from
+    resolve_pages and returning {title: (birth_date, death_date)}; titles
+    it has nothing for may be left out.
+    """
+    name = name or BACKEND
+    if name == 'wikitext':
+        return wikitext
+    if name == 'wikidata':
+        import wikidata  # imports this module, so it can't be imported at the top
+        return wikidata.backend
+    raise ValueError(f"Unknown lookup backend: {name}")
+
+
+def build_result(title, page_id, birth_date, death_date, description, rev_id=None):
+    """The lookup result dict stored on a pick"""
+    birth_dt = datetime.strptime(birth_date, '%Y-%m-%d')
+    death_age = None
+    if death_date:
+        death_dt = datetime.strptime(death_date, '%Y-%m-%d')
+        death_age = death_dt.year - birth_dt.year - ((death_dt.month, death_dt.day) < (birth_dt.month, birth_dt.day))
+
+    # Calculate current age (or age at death)
+    if death_date:
+        age = death_age
+    else:
+        today = datetime.now()
+        age = today.year - birth_dt.year - ((today.month, today.day) < (birth_dt.month, birth_dt.day))
+
+    return {
+        'age': age,
+        'birth_date': birth_date,
+        'death_date': death_date,
+        'death_age': death_age,
+        'wiki_url': f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}",
+        'description': description,
+        'title': title,
+        'page_id': page_id,
+        'rev_id': rev_id,
+    }
+
+
+def lookup_pages(pages, backend=None):
+    """{page_id: lookup result or None} for page infos from resolve_pages or current_revisions"""
+    backend = backend or get_backend()
+    pages = list({page['page_id']: page for page in pages}.values())
+    dates = backend.dates(pages) if pages else {}
+
+    results = {}
+    for page in pages:
+        birth_date, death_date = dates.get(page['title'], (None, None))
+        results[page['page_id']] = build_result(page['title'], page['page_id'], birth_date, death_date,
+                                                page['description'], page['rev_id']) if birth_date else None
+    return results
+
+
+def lookup_many(names, backend=None):
+    """{name: lookup result or None} for many names in a handful of requests.
+
+    A death in the local index is final, so those names are answered from
+    it. Anyone the dump has alive may have died since it was taken: their
+    page ids from the index skip the search, but their dates come from the
+    current revision.
+    """
+    names = list(dict.fromkeys(names))
+    _count('lookups', len(names))
+    results = {}
+    living = {}
+    for name, row in wiki_index.index.lookup(names).items():
+        if row['death_date']:
+            results[name] = build_result(row['title'], row['page_id'], row['birth_date'], row['death_date'],
+                                         row['description'], row['rev_id'])
+        else:
+            living[name] = row['page_id']
+    _count('index_hits', len(results))
+
+    if living:
+        current = current_revisions(set(living.values()))
+        found = lookup_pages(current.values(), backend)
+        for name, page_id in living.items():
+            if page_id in current:  # a deleted page falls through to a search by name
+                results[name] = found[page_id]
+
+    rest = [name for name in names if name not in results]
+    if rest:
+        pages = resolve_pages(rest)
+        found = lookup_pages([page for page in pages.values() if page], backend)
+        for name in rest:
+            results[name] = found[pages[name]['page_id']] if pages[name] else None
+    return results
+
+
+def lookup_batches(names, concurrency=CONCURRENCY, backend=None):
+    """Run lookup_many over BATCH_SIZE chunks of names on ``concurrency`` threads.
+
+    Yields (chunk, results, seconds, error) as each chunk finishes; results
+    is None and error is set when the chunk failed.
+    """
+    def timed(chunk):
+        start = time.monotonic()
+        return lookup_many(chunk, backend), time.monotonic() - start
+
+    backend = backend or get_backend()
+    names = list(dict.fromkeys(names))
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(timed, chunk): chunk for chunk in _chunks(names, BATCH_SIZE)}
+        for future in as_completed(futures):
+            try:
+                results, seconds = future.result()
+            except Exception as e:
+                yield futures[future], None, None, e
+                continue
+            yield futures[future], results, seconds, None
+
+
+def get_wikipedia_age(celebrity_name, backend=None):
+    """Fetch age from Wikipedia using their API
+
+    Returns None when Wikipedia has no usable page for the name. Network
+    errors and non-200 responses raise, so callers can retry them.
+    """
+    return lookup_many([celebrity_name], backend)[celebrity_name]
@@ -0,0 +1,89 @@
+"""Local birth/death index built from a Wikipedia dump by dump_import.py.
+
+When the index file exists, ``wiki_client.lookup_many`` answers names of
+people it records as dead from it. People it has alive are looked up by
+page id in the live API, since they may have died after the dump. A name
+matches a page title exactly (with MediaWiki's first-letter
+capitalization), a redirect to one, or failing that a single person with
+the same normalized name.
+"""
+import os
+import sqlite3
+
+import names
+
+INDEX_PATH = os.environ.get('WIKI_INDEX_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wiki_index.db'))
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS people (
+        page_id INTEGER PRIMARY KEY,
+        title TEXT NOT NULL,
+        rev_id INTEGER,
+        birth_date TEXT NOT NULL,
+        death_date TEXT,
+        description TEXT,
+        name_key TEXT
+    );
+    CREATE TABLE IF NOT EXISTS redirects (
+        title TEXT PRIMARY KEY,
+        target TEXT NOT NULL
+    );
+"""
+# Built after a bulk import rather than maintained row by row during it
+INDEXES = """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_people_title ON people(title);
+    CREATE INDEX IF NOT EXISTS idx_people_name_key ON people(name_key);
+"""
+COLUMNS = 'page_id, title, rev_id, birth_date, death_date, description'
+
+
+def page_title(name):
+    """A name as MediaWiki would normalize it into a title"""
+    title = ' '.join(name.replace('_', ' ').split())
+    return title[:1].upper() + title[1:]
+
+
+class LocalIndex:
+    """Read side of the index; every lookup opens the file read-only"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def available(self):
+        return os.path.exists(self.path)
+
+    def _find(self, conn, name):
+        title = page_title(name)
+        row = conn.execute(f"SELECT {COLUMNS} FROM people WHERE title = ?", (title,)).fetchone()
+        if row:
+            return row
+        target = conn.execute("SELECT target FROM redirects WHERE title = ?", (title,)).fetchone()
+        if target:
+            row = conn.execute(f"SELECT {COLUMNS} FROM people WHERE title = ?", (target[0],)).fetchone()
+            if row:
+                return row
+        name_key = names.normalize(name)
+        if not name_key:
+            return None
+        # Two people with the same normalized name is ambiguous; leave it to the API's search
+        rows = conn.execute(f"SELECT {COLUMNS} FROM people WHERE name_key = ? LIMIT 2", (name_key,)).fetchall()
+        return rows[0] if len(rows) == 1 else None
+
+    def lookup(self, celebrity_names):
+        """{name: row} for the names the index knows; rows are dicts of COLUMNS"""
+        if not self.available():
+            return {}
+        conn = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            found = {}
+            for name in celebrity_names:
+                row = self._find(conn, name)
+                if row:
+                    found[name] = dict(row)
+        finally:
+            conn.close()
+        return found
+
+
+index = LocalIndex(INDEX_PATH)
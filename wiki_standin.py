@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Local stand-in for the Wikipedia and Wikidata APIs, serving saved responses.
+
+Usage:
+    python3 wiki_standin.py serve [port] [--record]
+    python3 wiki_standin.py check
+
+``serve`` answers on http://127.0.0.1:<port> (default 8089). Point the
+clients at it with
+
+    WIKIPEDIA_API_URL=http://127.0.0.1:8089/w/api.php
+    WIKIDATA_API_URL=http://127.0.0.1:8089/wikidata/api.php
+
+Requests are matched on path and query parameters (``format`` and
+``maxlag`` ignored) against the entries in fixtures/api/*.json. Anything
+unmatched gets a 404, or with --record is forwarded to the real API and
+its response saved to fixtures/api/recorded.json.
+
+``check`` starts the stand-in on a free port, runs lookup_many with each
+backend against it, and compares the dates with the file's "expected".
+"""
+import glob
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'api')
+UPSTREAM = {
+    '/w/api.php': 'https://en.wikipedia.org/w/api.php',
+    '/wikidata/api.php': 'https://www.wikidata.org/w/api.php',
+}
+IGNORED = {'format', 'maxlag'}
+
+
+def _key(path, params):
+    return path, tuple(sorted((k, str(v)) for k, v in params.items() if k not in IGNORED))
+
+
+def load():
+    """({(path, params): response}, {name: [birth, death]}) from every fixture file"""
+    responses = {}
+    expected = {}
+    for filename in sorted(glob.glob(os.path.join(FIXTURES, '*.json'))):
+        with open(filename) as f:
+            fixture = json.load(f)
+        for entry in fixture.get('responses', []):
+            responses[_key(entry['path'], entry['params'])] = entry['response']
+        expected.update(fixture.get('expected', {}))
+    return responses, expected
+
+
+def make_server(port, record=False):
+    responses, _ = load()
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            params = dict(parse_qsl(url.query))
+            key = _key(url.path, params)
+            with lock:
+                response = responses.get(key)
+            if response is None and record and url.path in UPSTREAM:
+                response = self._record(url.path, params, key)
+            if response is None:
+                print(f"stand-in: no saved response for {url.path} {dict(key[1])}", file=sys.stderr)
+                self._send(404, {'error': {'code': 'standin-miss', 'info': 'No saved response'}})
+                return
+            self._send(200, response)
+
+        def _record(self, path, params, key):
+            import requests
+            upstream = requests.get(UPSTREAM[path], params=params, timeout=30,
+                                    headers={'User-Agent': 'DeathpoolApp/1.0 (Educational project; Python/Requests)'})
+            upstream.raise_for_status()
+            response = upstream.json()
+            filename = os.path.join(FIXTURES, 'recorded.json')
+            with lock:
+                responses[key] = response
+                fixture = {'responses': []}
+                if os.path.exists(filename):
+                    with open(filename) as f:
+                        fixture = json.load(f)
+                fixture['responses'].append({'path': path, 'params': dict(key[1]), 'response': response})
+                with open(filename, 'w') as f:
+                    json.dump(fixture, f, indent=1)
+            return response
+
+        def _send(self, status, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer(('127.0.0.1', port), Handler)
+
+
+def check():
+    server = make_server(0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+    os.environ['WIKIPEDIA_API_URL'] = base + '/w/api.php'
+    os.environ['WIKIDATA_API_URL'] = base + '/wikidata/api.php'
+    os.environ['WIKI_CACHE_PATH'] = os.path.join(tempfile.mkdtemp(), 'wiki_cache.db')
+
+    import wiki_client
+    _, expected = load()
+    ok = True
+    for name in ('wikitext', 'wikidata'):
+        wiki_client.cache = wiki_client.DiskCache(os.path.join(tempfile.mkdtemp(), 'wiki_cache.db'))
+        before = wiki_client.stats()
+        results = wiki_client.lookup_many(list(expected), wiki_client.get_backend(name))
+        after = wiki_client.stats()
+        wrong = {}
+        for celebrity, dates in expected.items():
+            result = results[celebrity]
+            got = (result['birth_date'], result['death_date']) if result else None
+            if got != tuple(dates):
+                wrong[celebrity] = (got, tuple(dates))
+        ok = ok and not wrong
+        print(f"{name:9s} {len(expected) - len(wrong)}/{len(expected)} correct, "
+              f"{after['requests'] - before['requests']} requests, "
+              f"{after['content_bytes'] - before['content_bytes']} content bytes")
+        for celebrity, (got, want) in wrong.items():
+            print(f"  {celebrity}: got {got}, expected {want}")
+    server.shutdown()
+    return ok
+
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else 'check'
+    if command == 'serve':
+        args = [arg for arg in sys.argv[2:] if arg != '--record']
+        port = int(args[0]) if args else 8089
+        print(f"Serving saved API responses on http://127.0.0.1:{port}")
+        make_server(port, record='--record' in sys.argv).serve_forever()
+    else:
+        sys.exit(0 if check() else 1)
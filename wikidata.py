@@ -0,0 +1,105 @@
+"""Wikidata lookup backend: birth and death dates from structured claims.
+
+Instead of parsing an article's infobox, this reads date of birth (P569)
+and date of death (P570) from the page's Wikidata item. Page resolution
+is shared with the wikitext backend, and already brings back each page's
+item id (its QID) from ``pageprops``; pages that arrive without one are
+resolved by page id, BATCH_SIZE per request. Items are then fetched
+BATCH_SIZE per ``wbgetentities`` call.
+
+People whose item has no day-precise birth date fall back to the
+wikitext backend, so switching backends never loses a lookup.
+
+Select it with LOOKUP_BACKEND=wikidata.
+"""
+import os
+from datetime import date
+
+import wiki_client
+
+API_URL = os.environ.get('WIKIDATA_API_URL', 'https://www.wikidata.org/w/api.php')
+
+BIRTH = 'P569'
+DEATH = 'P570'
+DAY_PRECISION = 11  # Wikidata time precision for a full date
+
+
+def resolve_qids(pages):
+    """Fill in the 'qid' of page infos that don't have one, by page id"""
+    missing = [page for page in pages if not page.get('qid')]
+    for chunk in wiki_client._chunks(missing, wiki_client.BATCH_SIZE):
+        data = wiki_client.api_get({
+            'action': 'query',
+            'pageids': '|'.join(str(page['page_id']) for page in chunk),
+            'prop': 'pageprops',
+            'ppprop': 'wikibase_item',
+        })
+        found = data.get('query', {}).get('pages', {})
+        for page in chunk:
+            props = found.get(str(page['page_id']), {}).get('pageprops', {})
+            page['qid'] = props.get('wikibase_item')
+
+
+def get_entities(qids):
+    """{qid: entity} with claims for a list of item ids, BATCH_SIZE per request"""
+    entities = {}
+    for chunk in wiki_client._chunks(list(dict.fromkeys(qids)), wiki_client.BATCH_SIZE):
+        data = wiki_client.api_get({
+            'action': 'wbgetentities',
+            'ids': '|'.join(chunk),
+            'props': 'claims',
+        }, content=True, url=API_URL)
+        for qid, entity in data.get('entities', {}).items():
+            if 'missing' not in entity:
+                entities[qid] = entity
+    return entities
+
+
+def claim_date(entity, prop):
+    """YYYY-MM-DD of an item's best day-precise time claim, or None"""
+    statements = [s for s in entity.get('claims', {}).get(prop, []) if s.get('rank') != 'deprecated']
+    # Preferred statements first; otherwise Wikidata's own order
+    statements.sort(key=lambda s: s.get('rank') != 'preferred')
+    for statement in statements:
+        snak = statement.get('mainsnak', {})
+        if snak.get('snaktype') != 'value':
+            continue
+        value = snak['datavalue']['value']
+        if value.get('precision', 0) < DAY_PRECISION or not value['time'].startswith('+'):
+            continue
+        try:
+            return date.fromisoformat(value['time'][1:11]).isoformat()
+        except ValueError:
+            continue  # e.g. +1950-00-00 from an imprecise source
+    return None
+
+
+class WikidataBackend:
+    """Dates from P569/P570 claims, with the wikitext backend as a fallback"""
+
+    name = 'wikidata'
+
+    def __init__(self, fallback=wiki_client.wikitext):
+        self.fallback = fallback
+
+    def dates(self, pages):
+        """{title: (birth_date, death_date)} for page infos from resolve_pages"""
+        resolve_qids(pages)
+        entities = get_entities([page['qid'] for page in pages if page.get('qid')])
+
+        dates = {}
+        leftover = []
+        for page in pages:
+            entity = entities.get(page.get('qid'))
+            birth_date = claim_date(entity, BIRTH) if entity else None
+            if birth_date:
+                dates[page['title']] = (birth_date, claim_date(entity, DEATH))
+            else:
+                leftover.append(page)
+        if leftover and self.fallback:
+            wiki_client._count('wikidata_fallbacks', len(leftover))
+            dates.update(self.fallback.dates(leftover))
+        return dates
+
+
+backend = WikidataBackend()